@@ -2,6 +2,12 @@
 # ABOUTME: Tests for the model configuration module.
 # ABOUTME: Verifies model tokens and pricing configurations.
 
+import json
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
 from translator.config import ModelConfig
 
 
@@ -48,6 +54,14 @@ def test_get_model_info_with_unknown_model():
     assert model_info["output_cost"] == 0.0
 
 
+def test_get_model_info_default_not_shared():
+    """Test that changing an unknown model's info leaves the default intact."""
+    model_info = ModelConfig.get_model_info("non-existent-model")
+    model_info["max_tokens"] = 1
+
+    assert ModelConfig.get_model_info("other-model")["max_tokens"] == 4000
+
+
 def test_get_max_tokens_with_known_model():
     """Test retrieving max tokens for a known model."""
     # Get max tokens for gpt-4
@@ -183,3 +197,69 @@ def test_pricing_consistency():
         # Skip if there are any exceptions to this rule
         if model_name not in ["custom-exception-model"]:
             assert model_info["output_cost"] >= model_info["input_cost"]
+
+
+def _mock_models_list(*model_ids):
+    """Build a stand-in for the OpenAI client's models.list() response."""
+    return SimpleNamespace(data=[SimpleNamespace(id=model_id) for model_id in model_ids])
+
+
+def test_get_available_openai_models_fetches_and_caches(tmp_path, monkeypatch):
+    """Test that fetched API models are filtered, sorted and written to the cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    with patch("openai.OpenAI") as mock_openai:
+        mock_openai.return_value.models.list.return_value = _mock_models_list(
+            "gpt-5", "whisper-1", "gpt-4o"
+        )
+        assert ModelConfig.get_available_openai_models() == ["gpt-4o", "gpt-5"]
+
+    with open(ModelConfig.get_api_models_cache_path(), encoding="utf-8") as file:
+        assert json.load(file) == ["gpt-4o", "gpt-5"]
+
+
+def test_get_available_openai_models_uses_fresh_cache(tmp_path, monkeypatch):
+    """Test that a fresh cache is returned without calling the API."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    ModelConfig._write_api_models_cache(["gpt-cached"])
+
+    with patch("openai.OpenAI") as mock_openai:
+        assert ModelConfig.get_available_openai_models() == ["gpt-cached"]
+        mock_openai.assert_not_called()
+
+
+def test_get_available_openai_models_falls_back_to_stale_cache(tmp_path, monkeypatch):
+    """Test that an expired cache is refreshed, and reused when the refresh fails."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    ModelConfig._write_api_models_cache(["gpt-stale"])
+    expired = time.time() - ModelConfig.API_MODELS_CACHE_TTL - 60
+    os.utime(ModelConfig.get_api_models_cache_path(), (expired, expired))
+
+    with patch("openai.OpenAI", side_effect=Exception("offline")):
+        assert ModelConfig.get_available_openai_models() == ["gpt-stale"]
+
+
+def test_get_available_openai_models_without_cache_or_api(tmp_path, monkeypatch):
+    """Test that an empty list is returned when the API fails and nothing is cached."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    with patch("openai.OpenAI", side_effect=Exception("offline")):
+        assert ModelConfig.get_available_openai_models() == []
+
+
+def test_get_available_openai_models_disabled_by_env(tmp_path, monkeypatch):
+    """Test that the remote model list can be turned off without touching the network."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("TRANSLATOR_DISABLE_REMOTE_MODELS", "1")
+    ModelConfig._write_api_models_cache(["gpt-cached"])
+
+    with patch("openai.OpenAI") as mock_openai:
+        assert ModelConfig.get_available_openai_models() == []
+        mock_openai.assert_not_called()
+
+
+def test_write_api_models_cache_removes_partial_file(tmp_path, monkeypatch):
+    """Test that a failed cache write doesn't leave its temporary file behind."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    with patch("translator.config.json.dump", side_effect=OSError("disk full")):
+        ModelConfig._write_api_models_cache(["gpt-4o"])
+
+    assert os.listdir(os.path.dirname(ModelConfig.get_api_models_cache_path())) == []
@@ -145,6 +145,36 @@ def test_estimate_cost_with_mock_costs():
             assert cost == 0.032
 
 
+def test_estimate_cost_critique_loops_with_mock_costs():
+    """Test that every critique loop adds the same, exactly computed cost."""
+    token_count = 1001
+    model = "test-model"
+
+    with patch.object(ModelConfig, "get_input_cost", return_value=0.01):
+        with patch.object(ModelConfig, "get_output_cost", return_value=0.02):
+            cost, _ = CostEstimator.estimate_cost(
+                token_count, model, with_edit=False, with_critique=True, critique_loops=3
+            )
+
+    # Translation: 1201 input tokens at $0.01 + 1001 output tokens at $0.02
+    translation_cost = 1.201 * 0.01 + 1.001 * 0.02
+    # Per loop: critique 2202 in / 1501 out, feedback 3703.5 in / 1001 out
+    loop_cost = 2.202 * 0.01 + 1.501 * 0.02 + 3.7035 * 0.01 + 1.001 * 0.02
+    assert abs(cost - (translation_cost + 3 * loop_cost)) < 1e-12
+
+
+def test_estimate_cost_bills_every_pass_at_full_input_price():
+    """Test that no pass is discounted for prompt caching."""
+    with patch.object(ModelConfig, "get_input_cost", return_value=0.01):
+        with patch.object(ModelConfig, "get_output_cost", return_value=0.02):
+            cost, _ = CostEstimator.estimate_cost(
+                1000, "test-model", with_edit=True, with_critique=True, critique_loops=2
+            )
+
+    # Translation $0.032 + editing $0.042 + 2 x (critique $0.052 + feedback $0.057)
+    assert round(cost, 6) == 0.292
+
+
 def test_estimate_cost_small_amount_formatting():
     """Test formatting of very small cost estimates."""
     token_count = 10  # Very small token count
@@ -2,6 +2,7 @@
 # ABOUTME: Tests for the file handler module.
 # ABOUTME: Verifies file operations functionality.
 
+import json
 import os
 import pytest
 import tempfile
@@ -120,6 +121,75 @@ def test_write_log():
             assert "timestamp" in content
 
 
+def test_write_log_without_orjson():
+    """Test that logs are written with the standard json module when orjson is missing."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_path = os.path.join(temp_dir, "test.log")
+
+        with patch("translator.file_handler.orjson", None):
+            FileHandler.write_log(log_path, {"translation": "Café", "model": "gpt-4"})
+
+        with open(log_path, "r", encoding="utf-8") as f:
+            log = json.load(f)
+        assert log["translation"] == "Café"
+        assert "timestamp" in log
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_log_compact_unless_pretty(use_orjson):
+    """Test that logs are compact by default and indented when requested."""
+    import translator.file_handler as file_handler
+
+    if use_orjson and file_handler.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        compact_path = os.path.join(temp_dir, "compact.log")
+        pretty_path = os.path.join(temp_dir, "pretty.log")
+        log_data = {"translation": "Test content", "usage": {"total_tokens": 3}}
+
+        orjson_module = file_handler.orjson if use_orjson else None
+        with patch("translator.file_handler.orjson", orjson_module):
+            FileHandler.write_log(compact_path, dict(log_data))
+            FileHandler.write_log(pretty_path, dict(log_data), pretty=True)
+
+        with open(compact_path, "r", encoding="utf-8") as f:
+            compact = f.read()
+        with open(pretty_path, "r", encoding="utf-8") as f:
+            pretty = f.read()
+
+        assert "\n" not in compact
+        assert '"usage":{"total_tokens":3}' in compact
+        assert '\n  "usage": {' in pretty
+
+
+def test_write_log_replaces_existing_log_atomically():
+    """Test that logs are written via a temporary file that is renamed into place."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_path = os.path.join(temp_dir, "test.log")
+        with open(log_path, "w", encoding="utf-8") as f:
+            f.write("old log")
+
+        with patch("translator.file_handler.os.replace", wraps=os.replace) as mock_replace:
+            FileHandler.write_log(log_path, {"model": "gpt-4"})
+
+        mock_replace.assert_called_once_with(f"{log_path}.tmp", log_path)
+        assert os.listdir(temp_dir) == ["test.log"]
+        with open(log_path, "r", encoding="utf-8") as f:
+            assert json.load(f)["model"] == "gpt-4"
+
+
+def test_write_log_removes_temporary_file_on_failure():
+    """Test that a failed rename leaves neither a temporary file nor a new log."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_path = os.path.join(temp_dir, "test.log")
+
+        with patch("translator.file_handler.os.replace", side_effect=OSError("busy")):
+            FileHandler.write_log(log_path, {"model": "gpt-4"})
+
+        assert os.listdir(temp_dir) == []
+
+
 def test_write_log_error():
     """Test error handling when writing log fails."""
     with patch("builtins.open", side_effect=Exception("Test error")):
@@ -145,3 +215,10 @@ def test_get_log_filename_different_extensions():
     output_file = "/path/to/data.es.json"
     log_path = FileHandler.get_log_filename(output_file)
     assert log_path == "/path/to/data.es.json.log.json"
+
+
+def test_get_narrative_filename():
+    """Test generating narrative filenames from output filenames."""
+    assert FileHandler.get_narrative_filename("/path/to/doc.fr.md") == "/path/to/doc.fr.log"
+    assert FileHandler.get_narrative_filename("/path/to/custom.md") == "/path/to/custom.log"
+    assert FileHandler.get_narrative_filename("/path/to/doc.fr.v2.md") == "/path/to/doc.fr.log"
@@ -80,7 +80,7 @@ def test_parse_frontmatter_error_handling():
     """Test error handling during frontmatter parsing."""
     # Mock frontmatter.loads to raise an exception
     with patch("frontmatter.loads", side_effect=Exception("Test error")):
-        content = "Some content that will trigger an error when parsed."
+        content = "---\ntitle: Test\n---\nSome content that will trigger an error when parsed."
 
         # Call the method, should handle the exception gracefully
         has_frontmatter, metadata, content_without_frontmatter = (
@@ -93,6 +93,53 @@ def test_parse_frontmatter_error_handling():
         assert content_without_frontmatter is None
 
 
+def test_split_frontmatter_returns_raw_block():
+    """Test that split_frontmatter returns the raw frontmatter block."""
+    content = """---
+title: Test Title
+description: Test Description
+---
+
+This is the actual content of the document.
+"""
+
+    has_frontmatter, metadata, content_without_frontmatter, raw_frontmatter = (
+        FrontmatterHandler.split_frontmatter(content)
+    )
+
+    assert has_frontmatter is True
+    assert metadata["title"] == "Test Title"
+    assert content_without_frontmatter == "This is the actual content of the document."
+    assert raw_frontmatter == "---\ntitle: Test Title\ndescription: Test Description\n---\n\n"
+    assert raw_frontmatter + content_without_frontmatter == content.rstrip()
+
+
+def test_split_frontmatter_without_frontmatter():
+    """Test split_frontmatter on content without frontmatter."""
+    result = FrontmatterHandler.split_frontmatter("Just regular content.")
+    assert result == (False, None, None, None)
+
+
+def test_split_frontmatter_skips_parser_without_delimiter():
+    """Test that content not opening with a delimiter is never handed to python-frontmatter."""
+    with patch("frontmatter.loads") as mock_loads:
+        result = FrontmatterHandler.split_frontmatter("\n  # Heading\n\nBody text.")
+
+    assert result == (False, None, None, None)
+    mock_loads.assert_not_called()
+
+
+def test_split_frontmatter_with_leading_whitespace():
+    """Test that frontmatter after leading blank lines is still detected."""
+    has_frontmatter, metadata, content_without_frontmatter, _ = (
+        FrontmatterHandler.split_frontmatter("\n\n---\ntitle: Test Title\n---\nBody text.\n")
+    )
+
+    assert has_frontmatter is True
+    assert metadata == {"title": "Test Title"}
+    assert content_without_frontmatter == "Body text."
+
+
 def test_get_translatable_frontmatter_fields():
     """Test getting translatable fields from frontmatter."""
     # Create sample frontmatter with various fields
@@ -3,9 +3,29 @@
 # ABOUTME: Verifies language code detection functionality.
 
 from unittest.mock import patch, MagicMock
+
+import pytest
+
 from translator.language import LanguageHandler
 
 
+@pytest.fixture(autouse=True)
+def clear_language_code_cache():
+    """Clear cached lookups so mocked pycountry results don't leak between tests."""
+    LanguageHandler.get_language_code.cache_clear()
+    yield
+    LanguageHandler.get_language_code.cache_clear()
+
+
+def test_get_language_code_cached():
+    """Test that repeated lookups are served from the cache."""
+    with patch("pycountry.languages.get") as mock_get:
+        mock_get.return_value = MagicMock(alpha_2="sq")
+        assert LanguageHandler.get_language_code("Albanian") == "sq"
+        assert LanguageHandler.get_language_code("Albanian") == "sq"
+        mock_get.assert_called_once()
+
+
 def test_get_language_code_common_languages():
     """Test language code detection for common languages."""
     assert LanguageHandler.get_language_code("English") == "en"
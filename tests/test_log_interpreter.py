@@ -76,6 +76,30 @@ class TestLogInterpreter(unittest.TestCase):
             # Clean up the temporary file
             os.unlink(temp_file_path)
 
+    def test_read_log_file_without_orjson(self):
+        """Test reading a log file with the standard json module when orjson is missing."""
+        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
+            json.dump(self.sample_log_data, temp_file)
+            temp_file_path = temp_file.name
+
+        try:
+            with patch("translator.log_interpreter.orjson", None):
+                log_data = self.log_interpreter.read_log_file(temp_file_path)
+            self.assertEqual(log_data, self.sample_log_data)
+        finally:
+            os.unlink(temp_file_path)
+
+    def test_read_invalid_log_file(self):
+        """Test reading a log file that is not valid JSON."""
+        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
+            temp_file.write("{not json")
+            temp_file_path = temp_file.name
+
+        try:
+            self.assertIsNone(self.log_interpreter.read_log_file(temp_file_path))
+        finally:
+            os.unlink(temp_file_path)
+
     def test_read_nonexistent_log_file(self):
         """Test reading a non-existent log file."""
         result = self.log_interpreter.read_log_file("/nonexistent/file.log")
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# ABOUTME: Test cases for the AI provider abstraction.
+# ABOUTME: Verifies provider detection from model names and prefixes.
+
+import pytest
+
+from translator.providers import AnthropicProvider, OpenAIProvider, ProviderFactory
+
+
+@pytest.mark.parametrize(
+    "model, expected",
+    [
+        ("gpt-4", "openai"),
+        ("claude-3-opus-20240229", "anthropic"),
+        ("openai:some-new-model", "openai"),
+        ("Anthropic:claude-next", "anthropic"),
+        ("unknown-model", None),
+        ("other:gpt-4", None),
+    ],
+)
+def test_get_provider_name(model, expected):
+    """Test detecting the provider for prefixed and unprefixed model names."""
+    assert ProviderFactory.get_provider_name(model) == expected
+
+
+def test_create_provider():
+    """Test creating providers and rejecting missing clients or unknown models."""
+    assert isinstance(ProviderFactory.create_provider("gpt-4", openai_client=object()), OpenAIProvider)
+    assert isinstance(
+        ProviderFactory.create_provider("anthropic:claude-next", anthropic_client=object()),
+        AnthropicProvider,
+    )
+
+    with pytest.raises(ValueError, match="Anthropic client required"):
+        ProviderFactory.create_provider("claude-3-opus-20240229", openai_client=object())
+    with pytest.raises(ValueError, match="Unsupported model"):
+        ProviderFactory.create_provider("unknown-model", openai_client=object())
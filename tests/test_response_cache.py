@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# ABOUTME: Tests for the persistent response cache.
+# ABOUTME: Verifies storing, retrieving, and keying of cached model responses.
+
+import os
+import tempfile
+
+import pytest
+
+from translator.response_cache import ResponseCache
+
+
+@pytest.fixture
+def cache():
+    """Create a response cache backed by a temporary database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield ResponseCache(os.path.join(temp_dir, "cache", "responses.sqlite3"))
+
+
+def test_get_missing_key(cache):
+    """Test that unknown keys are cache misses."""
+    assert cache.get(ResponseCache.make_key("translation", "gpt-4", "French", "", "Hi")) is None
+
+
+def test_set_and_get(cache):
+    """Test storing and retrieving a response with its usage."""
+    key = ResponseCache.make_key("translation", "gpt-4", "French", "system", "Hello")
+    usage = {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30}
+
+    cache.set(key, "Bonjour", usage)
+
+    assert cache.get(key) == ("Bonjour", usage)
+
+
+def test_cache_persists_across_instances(cache):
+    """Test that cached responses survive reopening the database."""
+    key = ResponseCache.make_key("editing", "gpt-4", "German", "system", "Hallo")
+    cache.set(key, "Hallo!", {})
+
+    assert ResponseCache(cache.path).get(key) == ("Hallo!", {})
+
+
+def test_make_key_depends_on_every_part():
+    """Test that changing any part of the request changes the key."""
+    base = ("translation", "gpt-4", "French", "system", "Hello")
+    key = ResponseCache.make_key(*base)
+    for i in range(len(base)):
+        changed = list(base)
+        changed[i] += "x"
+        assert ResponseCache.make_key(*changed) != key
+
+
+def test_default_path_respects_xdg_cache_home(monkeypatch):
+    """Test that the default location follows XDG_CACHE_HOME."""
+    monkeypatch.setenv("XDG_CACHE_HOME", "/tmp/xdg-cache")
+    assert ResponseCache.default_path() == "/tmp/xdg-cache/translator/responses.sqlite3"
+
+
+def test_unavailable_cache_is_a_no_op():
+    """Test that an unusable database path disables caching instead of failing."""
+    cache = ResponseCache("/dev/null/not-a-directory/responses.sqlite3")
+    cache.set("key", "value", {})
+    assert cache.get("key") is None
@@ -2,10 +2,15 @@
 # ABOUTME: Unit tests for streaming functionality.
 # ABOUTME: Tests the streaming implementation of the OpenAI API.
 
+import argparse
+import signal
+import tempfile
+import time
 import unittest
 from unittest.mock import Mock, patch
 from translator.translator import Translator
-from translator.cli import CancellationHandler
+import translator.cli as cli
+from translator.cli import CancellationHandler, StreamingTokenDisplay
 
 
 class TestStreaming(unittest.TestCase):
@@ -129,6 +134,228 @@ class TestStreaming(unittest.TestCase):
             stream=True
         )
 
+    def test_eta_cached_until_tokens_grow(self):
+        """Test that the ETA string is only recomputed after 10% token growth."""
+        display = StreamingTokenDisplay("Translation", "o3")
+        display.tokens = 200
+        display.tokens_per_second = 10
+
+        with patch.object(display, "_format_time", wraps=display._format_time) as mock_format:
+            first = display._estimate_remaining()
+            display.tokens = 210  # +5%, below the recompute threshold
+            self.assertEqual(display._estimate_remaining(), first)
+            self.assertEqual(mock_format.call_count, 1)
+
+            display.tokens = 230  # +15%, recompute
+            display._estimate_remaining()
+            self.assertEqual(mock_format.call_count, 2)
+
+    def test_eta_hidden_for_short_streams(self):
+        """Test that no ETA is shown while the stream is still short."""
+        display = StreamingTokenDisplay("Translation", "o3")
+        display.start_time = time.time() - 10  # Past the 1s speed threshold
+        display.tokens = 50
+        display.tokens_per_second = 10
+
+        panel = display._generate_display()
+        self.assertIn("Speed", panel.renderable.plain)
+        self.assertNotIn("Est. remaining", panel.renderable.plain)
+
+        display.tokens = 150
+        panel = display._generate_display()
+        self.assertIn("Est. remaining", panel.renderable.plain)
+
+    @patch("translator.cli.Live")
+    def test_display_reused_across_phases(self, _mock_live):
+        """Test that one display can be switched to a new phase and restarted."""
+        display = StreamingTokenDisplay("Translation", "o3")
+        display.start()
+        display.update(42)
+        display.stop()
+
+        display.set_phase("Editing")
+        display.start()
+        self.assertEqual(display.tokens, 0)
+        panel = display._generate_display()
+        self.assertIn("Editing with model: o3", panel.renderable.plain)
+        display.stop()
+
+    @patch("translator.cli.Live")
+    def test_display_reset_without_live(self, mock_live):
+        """Test that reset() restarts the counters and timer without a live display."""
+        display = StreamingTokenDisplay("Frontmatter Translation", "o3")
+        display.tokens = 42
+        display.reset()
+
+        self.assertEqual(display.tokens, 0)
+        self.assertIsNotNone(display.start_time)
+        self.assertIsNone(display.live)
+        mock_live.assert_not_called()
+
+    def test_cancellation_handler_installed_lazily(self):
+        """Test that the SIGINT handler is only installed on first use."""
+        original_handler = signal.getsignal(signal.SIGINT)
+        with patch.object(cli, "_cancellation", None):
+            try:
+                handler = cli.get_cancellation()
+                self.assertIsInstance(handler, CancellationHandler)
+                self.assertIs(cli.get_cancellation(), handler)
+            finally:
+                signal.signal(signal.SIGINT, original_handler)
+
+    @patch("signal.signal")
+    def test_cancellation_handler_event(self, _mock_signal):
+        """Test that the cancellation flag is backed by a waitable event."""
+        handler = CancellationHandler()
+        self.assertFalse(handler.is_cancellation_requested())
+        self.assertFalse(handler.wait(0))
+
+        handler._signal_handler(signal.SIGINT, None)
+        self.assertTrue(handler.is_cancellation_requested())
+        self.assertTrue(handler.wait(0))
+
+        # A second Ctrl+C forces an exit
+        with self.assertRaises(SystemExit):
+            handler._signal_handler(signal.SIGINT, None)
+
+        handler.reset()
+        self.assertFalse(handler.is_cancellation_requested())
+
+    @patch("signal.signal")
+    def test_cancellation_session_clears_previous_request(self, _mock_signal):
+        """Test that a session starts uncancelled and sees cancellation within it."""
+        handler = CancellationHandler()
+        handler._signal_handler(signal.SIGINT, None)
+
+        with handler.session() as session:
+            self.assertIs(session, handler)
+            self.assertFalse(handler.is_cancellation_requested())
+            handler._signal_handler(signal.SIGINT, None)
+            self.assertTrue(handler.is_cancellation_requested())
+
+    @patch("signal.signal")
+    def test_shared_session_keeps_pending_cancellation(self, _mock_signal):
+        """Test that a request joining the caller's session doesn't clear a pending Ctrl+C."""
+        handler = CancellationHandler()
+        translator = Mock()
+        translator.translate_frontmatter.return_value = ({"title": "Titre"}, {}, None)
+
+        with handler.session() as session:
+            handler._signal_handler(signal.SIGINT, None)
+            cli.TranslatorCLI._translate_frontmatter(
+                True,
+                {"title": "Title"},
+                translator,
+                "French",
+                "o3",
+                show_progress=False,
+                cancellation=session,
+            )
+            self.assertTrue(handler.is_cancellation_requested())
+
+        kwargs = translator.translate_frontmatter.call_args.kwargs
+        self.assertIs(kwargs["cancellation_handler"], handler)
+
+    def test_background_call_runs_on_daemon_thread(self):
+        """Test that a background call returns its result and doesn't block exit."""
+        call = cli.BackgroundCall(lambda a, b=0: a + b, 1, b=2)
+        self.assertTrue(call._thread.daemon)
+        self.assertEqual(call.result(), 3)
+
+    def test_background_call_reraises_errors(self):
+        """Test that an exception from a background call surfaces in result()."""
+        def fail():
+            raise ValueError("boom")
+
+        call = cli.BackgroundCall(fail)
+        with self.assertRaises(ValueError):
+            call.result()
+
+    @patch("signal.signal")
+    @patch("translator.cli.console")
+    @patch("translator.cli.FileHandler")
+    @patch("translator.cli.LogInterpreter")
+    def test_narrative_streams_in_background(
+        self, mock_interpreter_cls, mock_file_handler, _mock_console, _mock_signal
+    ):
+        """Test that the narrative is streamed on a background call and then saved."""
+        interpreter = mock_interpreter_cls.return_value
+        interpreter.generate_narrative.return_value = "line1\nline2"
+        translator = Mock(translation_context="", translation_log={})
+
+        with patch.object(cli, "_cancellation", None):
+            cli.TranslatorCLI._finalize_and_save(
+                has_frontmatter=False,
+                translated_frontmatter=None,
+                translated_content="Bonjour",
+                input_file="post.md",
+                target_language="French",
+                output_path="post.fr.md",
+                log_path="post.fr.md.log",
+                narrative_path="post.fr.log",
+                total_usage=cli.Usage(),
+                model="o3",
+                translator=translator,
+                skip_edit=True,
+                do_critique=False,
+                critique_loops=0,
+                translation_usage=cli.Usage(),
+                edit_usage=cli.Usage(),
+                frontmatter_usage=cli.Usage(),
+                critique_usage=cli.Usage(),
+                feedback_usage=cli.Usage(),
+                critique_usages=[],
+                feedback_usages=[],
+            )
+            handler = cli._cancellation
+
+        mock_file_handler.write_log.assert_called_once()
+        kwargs = interpreter.generate_narrative.call_args.kwargs
+        self.assertTrue(kwargs["stream"])
+        self.assertIs(kwargs["cancellation_handler"], handler)
+        interpreter.write_narrative.assert_called_once_with("post.fr.log", "line1\nline2")
+
+    @patch("translator.cli.console")
+    def test_directory_input_rejected(self, mock_console):
+        """Test that a directory given as the input file fails validation clearly."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            args = argparse.Namespace(
+                list_models=False,
+                file=temp_dir,
+                language="French",
+                output=None,
+                model="o3",
+                no_edit=False,
+                no_critique=False,
+                critique_loops=1,
+                estimate_only=False,
+                headless=False,
+            )
+            has_valid_input = cli.TranslatorCLI._parse_and_validate_args(args)[8]
+
+        self.assertFalse(has_valid_input)
+        self.assertIn("is a directory", mock_console.print.call_args.args[0])
+
+    @patch("translator.cli.console")
+    def test_display_usage_table_prints_built_table(self, mock_console):
+        """Test that display_usage_table() still prints the usage table."""
+        cli.TranslatorCLI.display_usage_table(
+            total_usage=cli.Usage(3, 2, 5), translation_usage=cli.Usage(3, 2, 5)
+        )
+
+        table = mock_console.print.call_args.args[0]
+        self.assertIsInstance(table, cli.Table)
+        self.assertEqual(table.title, "Token Usage")
+
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
+    def test_missing_api_key_named_for_model_provider(self):
+        """Test that only the chosen provider's missing key is reported."""
+        missing = cli.TranslatorCLI._missing_api_keys
+        self.assertEqual(missing("openai", None, None), ["OPENAI_API_KEY"])
+        self.assertEqual(missing("anthropic", Mock(), None), ["ANTHROPIC_API_KEY"])
+        self.assertEqual(missing("openai", Mock(), None), [])
+        self.assertEqual(missing(None, None, None), [])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
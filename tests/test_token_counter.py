@@ -36,6 +36,17 @@ def test_count_tokens_identical_for_o3_and_gpt4():
     assert o3_count == gpt4_count
 
 
+def test_count_tokens_allows_special_tokens():
+    """Test that special token text is counted instead of raising."""
+    mock_encoding = MagicMock()
+    mock_encoding.encode.return_value = [1, 2, 3]
+    with patch.object(TokenCounter, "_get_encoding", return_value=mock_encoding):
+        assert TokenCounter.count_tokens("<|endoftext|>", "gpt-4") == 3
+        mock_encoding.encode.assert_called_once_with(
+            "<|endoftext|>", disallowed_special=()
+        )
+
+
 def test_count_tokens_different_languages():
     """Test token counting for different languages."""
     # Sample texts in different languages
@@ -135,6 +146,28 @@ def test_check_token_limits_at_boundary():
             assert counted_tokens == token_count
 
 
+def test_check_token_limits_with_precomputed_count():
+    """Test that a known token count skips re-encoding the content."""
+    with patch.object(TokenCounter, "count_tokens") as mock_count_tokens:
+        with patch.object(ModelConfig, "get_max_tokens", return_value=40000):
+            within_limits, counted_tokens = TokenCounter.check_token_limits(
+                "Test text", "test-model", token_count=1000
+            )
+    mock_count_tokens.assert_not_called()
+    assert within_limits is True
+    assert counted_tokens == 1000
+
+
+def test_count_many():
+    """Test counting several texts with one encoding lookup."""
+    mock_encoding = MagicMock()
+    mock_encoding.encode.side_effect = lambda text, **_kwargs: text.split()
+    with patch.object(TokenCounter, "_get_encoding", return_value=mock_encoding) as mock_get:
+        counts = TokenCounter.count_many(["one two", "three", ""], "gpt-4")
+    assert counts == [2, 1, 0]
+    mock_get.assert_called_once_with("gpt-4")
+
+
 def test_check_token_limits_different_models():
     """Test token limits for different models with different max tokens."""
     test_text = "Test text for different models"
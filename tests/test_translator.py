@@ -266,4 +266,42 @@ def test_translate_frontmatter_no_fields(translator_instance):
     assert usage["prompt_tokens"] == 0
     assert usage["completion_tokens"] == 0
     assert usage["total_tokens"] == 0
-    assert error_msg is None
\ No newline at end of file
+    assert error_msg is None
+
+@patch('translator.translator.ProviderFactory.create_provider')
+def test_translate_text_uses_response_cache(mock_provider_factory, tmp_path):
+    """Test that a cached response skips the provider and reports no usage."""
+    from translator.response_cache import ResponseCache
+
+    mock_provider = MagicMock()
+    mock_provider.translate_text.return_value = (
+        "Texto traducido.",
+        {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
+        None
+    )
+    mock_provider_factory.return_value = mock_provider
+
+    translator = Translator(
+        openai_client=MagicMock(),
+        response_cache=ResponseCache(str(tmp_path / "responses.sqlite3")),
+    )
+
+    first = translator.translate_text("Text to translate.", "Spanish", "gpt-4")
+    second = translator.translate_text("Text to translate.", "Spanish", "gpt-4")
+
+    assert first[0] == second[0] == "Texto traducido."
+    assert first[1]["total_tokens"] == 30
+    assert second[1]["total_tokens"] == 0
+    mock_provider.translate_text.assert_called_once()
+
+
+def test_is_actionable_critique():
+    """Test detecting critiques that found nothing to fix."""
+    assert not Translator.is_actionable_critique("")
+    assert not Translator.is_actionable_critique("  NO ISSUES\n")
+    assert not Translator.is_actionable_critique("Looks good.")
+    assert not Translator.is_actionable_critique("LGTM")
+    assert Translator.is_actionable_critique("1. 'Bonjur' should be 'Bonjour'")
+    assert Translator.is_actionable_critique(
+        "No issues with terminology, but the second paragraph is too literal."
+    )
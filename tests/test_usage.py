@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# ABOUTME: Tests for the token usage module.
+# ABOUTME: Verifies usage accumulation and conversion to and from dictionaries.
+
+from translator.usage import Usage
+
+
+def test_usage_defaults_to_zero():
+    """Test that a new usage record starts at zero."""
+    usage = Usage()
+    assert usage.to_dict() == {
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "total_tokens": 0,
+    }
+
+
+def test_usage_from_dict():
+    """Test creating a usage record from a usage dictionary."""
+    usage = Usage.from_dict(
+        {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30}
+    )
+    assert usage == Usage(10, 20, 30)
+
+
+def test_usage_from_empty_or_partial_dict():
+    """Test that missing keys and empty dictionaries count as zero."""
+    assert Usage.from_dict({}) == Usage()
+    assert Usage.from_dict(None) == Usage()
+    assert Usage.from_dict({"prompt_tokens": 5}) == Usage(5, 0, 0)
+
+
+def test_usage_add_usage_and_dict():
+    """Test adding usage records and usage dictionaries in place."""
+    total = Usage()
+    total += Usage(1, 2, 3)
+    total += {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30}
+    total += {}
+    assert total == Usage(11, 22, 33)
+
+
+def test_usage_has_no_instance_dict():
+    """Test that usage records are slotted."""
+    assert not hasattr(Usage(), "__dict__")
@@ -6,15 +6,13 @@ import argparse
 import os
 import signal
 import sys
+import threading
 import time
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-import frontmatter
-import openai
-import anthropic
 from dotenv import load_dotenv
-from rich.console import Console
+from rich.console import Console, Group
 from rich.live import Live
 from rich.markup import escape
 from rich.panel import Panel
@@ -25,13 +23,48 @@ from translator.config import ModelConfig
 from translator.cost import CostEstimator
 from translator.file_handler import FileHandler
 from translator.frontmatter_handler import FrontmatterHandler
+from translator.language import LanguageHandler
 from translator.log_interpreter import LogInterpreter
+from translator.providers import ProviderFactory
+from translator.response_cache import ResponseCache
 from translator.token_counter import TokenCounter
 from translator.translator import Translator
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from translator.usage import Usage
+
+if TYPE_CHECKING:
+    import anthropic
+    import openai
 
 console = Console()
 
+# File extensions that may carry static site generator frontmatter
+_MD_SUFFIXES = frozenset({".md", ".markdown", ".mdx"})
+
+# Answers accepted as "yes" by confirmation prompts
+_YES_ANSWERS = frozenset({"y", "yes"})
+
+
+def _preview_lines(text: str, limit: int) -> Tuple[List[str], int]:
+    """Split the first lines off a text for a preview.
+
+    Only the previewed prefix is split; the rest is just counted, so long
+    responses don't get materialized as a list of lines.
+
+    Args:
+        text: The text to preview
+        limit: Maximum number of lines to return
+
+    Returns:
+        Tuple of (first lines, number of remaining lines)
+    """
+    end = -1
+    for _ in range(limit):
+        end = text.find("\n", end + 1)
+        if end == -1:
+            return text.split("\n"), 0
+    return text[:end].split("\n"), text.count("\n", end + 1) + 1
+
+
 # Cancellation handler for early termination of streaming completions
 class CancellationHandler:
     """Handles cancellation requests for streaming completions.
@@ -45,7 +78,7 @@ class CancellationHandler:
     
     def __init__(self):
         """Initialize the cancellation handler."""
-        self.cancel_requested = False
+        self._event = threading.Event()
         # Register the signal handler
         signal.signal(signal.SIGINT, self._signal_handler)
     
@@ -59,9 +92,9 @@ class CancellationHandler:
             _sig: Signal number (unused)
             _frame: Current stack frame (unused)
         """
-        if not self.cancel_requested:
+        if not self._event.is_set():
             console.print("\n[bold yellow]Cancellation requested. Cleaning up...[/]")
-            self.cancel_requested = True
+            self._event.set()
             # We don't exit immediately - we set a flag and let the program clean up gracefully
         else:
             # If user presses Ctrl+C a second time, exit immediately
@@ -74,17 +107,99 @@ class CancellationHandler:
         Returns:
             bool: True if cancellation has been requested, False otherwise.
         """
-        return self.cancel_requested
+        return self._event.is_set()
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancellation is requested or the timeout expires.
+        
+        Use this instead of sleeping and polling is_cancellation_requested().
+        
+        Args:
+            timeout: Maximum number of seconds to wait (None waits indefinitely)
+        
+        Returns:
+            bool: True if cancellation has been requested, False on timeout.
+        """
+        return self._event.wait(timeout)
     
     def reset(self):
-        """Reset the cancellation flag.
+        """Reset the cancellation flag."""
+        self._event.clear()
+
+    @contextmanager
+    def session(self):
+        """Scope a single streaming operation.
         
-        Call this method at the beginning of each streaming operation.
+        Clears a cancellation left over from an earlier operation on entry, so
+        Ctrl+C only cancels the operation that was running when it was pressed.
+        The flag is only touched when it is actually set.
+        
+        Yields:
+            CancellationHandler: This handler, to pass to the streaming call.
         """
-        self.cancel_requested = False
+        if self._event.is_set():
+            self._event.clear()
+        yield self
         
-# Create a global cancellation handler instance
-cancellation = CancellationHandler()
+# Global cancellation handler, created on first use so that importing this
+# module (or running non-streaming commands) doesn't replace the SIGINT handler
+_cancellation = None
+
+
+def get_cancellation() -> CancellationHandler:
+    """Return the global cancellation handler, installing it on first use.
+
+    Returns:
+        CancellationHandler: The shared cancellation handler instance.
+    """
+    global _cancellation
+    if _cancellation is None:
+        _cancellation = CancellationHandler()
+    return _cancellation
+
+
+class BackgroundCall:
+    """Run a function on a daemon thread and collect its result later.
+
+    Unlike a ThreadPoolExecutor worker, a daemon thread is not joined when the
+    interpreter exits, so a forced exit never waits for a pending API request.
+    """
+
+    def __init__(self, func, *args, **kwargs):
+        """Start calling func(*args, **kwargs) in the background.
+
+        Args:
+            func: The function to call
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+        """
+        self._result = None
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, args=(func, args, kwargs), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, func, args, kwargs):
+        """Call the function, keeping its result or exception for result()."""
+        try:
+            self._result = func(*args, **kwargs)
+        except BaseException as e:  # pylint: disable=broad-except
+            self._error = e
+
+    def result(self):
+        """Wait for the call to finish and return its result.
+
+        Returns:
+            The function's return value.
+
+        Raises:
+            BaseException: Whatever the function raised, re-raised here.
+        """
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
 
 
 class StreamingTokenDisplay:
@@ -112,14 +227,39 @@ class StreamingTokenDisplay:
         self.last_update_time = None
         self.tokens_per_second = 0
         self.live = None
+        # Cached ETA string and the token count it was computed at
+        self._eta_tokens = 0
+        self._eta_formatted = None
         
-    def start(self):
+    def set_phase(self, operation_name: str):
         """
-        Starts the live token count display and initializes timing for streaming operations.
+        Switches the display to a new operation so one instance can be reused across phases.
+        
+        Call start() afterwards to reset the counters and timer for the new phase.
+        
+        Args:
+            operation_name: The name of the new operation (e.g., "Editing").
+        """
+        self.operation_name = operation_name
+
+    def reset(self):
+        """
+        Resets the token count and starts timing a new operation without showing the live display.
+        
+        Use this when another live display is already active, since only one can run at a time.
         """
         self.start_time = time.time()
         self.last_update_time = self.start_time
         self.tokens = 0
+        self.tokens_per_second = 0
+        self._eta_tokens = 0
+        self._eta_formatted = None
+
+    def start(self):
+        """
+        Starts the live token count display and initializes timing for streaming operations.
+        """
+        self.reset()
         
         # Create a live display that will be updated as tokens arrive
         # Use auto_refresh=False to prevent screen artifacting
@@ -170,7 +310,8 @@ class StreamingTokenDisplay:
         elapsed = time.time() - self.start_time
         return self._format_time(elapsed)
             
-    def _format_time(self, seconds):
+    @staticmethod
+    def _format_time(seconds):
         """
         Converts a duration in seconds to a human-readable time string.
         
@@ -189,6 +330,23 @@ class StreamingTokenDisplay:
             seconds = int(seconds % 60)
             return f"{hours}:{minutes:02d}:{seconds:02d}"
     
+    def _estimate_remaining(self):
+        """
+        Returns a formatted estimate of the remaining streaming time.
+        
+        The estimate is only recomputed once the token count has grown by at least
+        10% since the last computation; otherwise the cached string is returned.
+        """
+        if self._eta_formatted is None or self.tokens >= self._eta_tokens * 1.1:
+            # Calculate tokens per character based on a rough estimate
+            # This is very approximate but gives users a rough idea
+            estimated_total_tokens = self.tokens * 1.5  # Rough estimate
+            estimated_remaining = max(0, estimated_total_tokens - self.tokens)
+            remaining_seconds = estimated_remaining / self.tokens_per_second
+            self._eta_formatted = self._format_time(remaining_seconds)
+            self._eta_tokens = self.tokens
+        return self._eta_formatted
+    
     def _generate_display(self):
         """
         Generates a Rich Panel displaying live token statistics for the current operation.
@@ -218,18 +376,11 @@ class StreamingTokenDisplay:
             text.append("\n⚡ Speed: ", style="bright_white")
             text.append(f"{self.tokens_per_second:.1f} tokens/sec", style="yellow")
             
-            # Add estimated time if tokens are flowing
-            if self.tokens > 0 and self.tokens_per_second > 0:
-                # Calculate tokens per character based on a rough estimate
-                # This is very approximate but gives users a rough idea
-                estimated_total_tokens = self.tokens * 1.5  # Rough estimate
-                estimated_remaining = max(0, estimated_total_tokens - self.tokens)
-                
-                if estimated_remaining > 0 and self.tokens_per_second > 0:
-                    remaining_seconds = estimated_remaining / self.tokens_per_second
-                    remaining_formatted = self._format_time(remaining_seconds)
-                    text.append("\n⏳ Est. remaining: ", style="bright_white")
-                    text.append(f"{remaining_formatted}", style="cyan")
+            # Add estimated time once the stream is long and fast enough for
+            # the estimate to mean anything
+            if self.tokens > 100 and self.tokens_per_second > 5:
+                text.append("\n⏳ Est. remaining: ", style="bright_white")
+                text.append(self._estimate_remaining(), style="cyan")
         
         # Create a panel with the text
         panel = Panel(
@@ -246,7 +397,7 @@ class TranslatorCLI:
     """Command-line interface for the translator."""
 
     @classmethod
-    def setup_openai_client(cls) -> openai.OpenAI:
+    def setup_openai_client(cls) -> Optional["openai.OpenAI"]:
         """Set up and return an OpenAI client.
         
         Looks for the OpenAI API key in the following locations (in order of precedence):
@@ -282,13 +433,16 @@ class TranslatorCLI:
 
         # Return OpenAI client if API key is found, otherwise return None
         if api_key:
+            # The SDKs are slow to import, so only load them once a client is needed
+            import openai
+
             return openai.OpenAI(api_key=api_key)
 
         # OpenAI client not available, but that's OK if we have Anthropic
         return None
 
     @classmethod
-    def setup_anthropic_client(cls) -> Optional[anthropic.Anthropic]:
+    def setup_anthropic_client(cls) -> Optional["anthropic.Anthropic"]:
         """Set up and return an Anthropic client.
 
         Looks for the Anthropic API key in the following locations (in order of precedence):
@@ -306,13 +460,39 @@ class TranslatorCLI:
             # Anthropic is optional, so just return None if no key is found
             return None
 
+        import anthropic
+
         return anthropic.Anthropic(api_key=api_key)
 
+    @staticmethod
+    def _missing_api_keys(
+        provider: Optional[str],
+        openai_client: Optional["openai.OpenAI"],
+        anthropic_client: Optional["anthropic.Anthropic"],
+    ) -> List[str]:
+        """Work out which API keys are missing for the chosen model's provider.
+
+        Args:
+            provider: Provider serving the model ("openai", "anthropic", or None if unrecognized)
+            openai_client: OpenAI client, or None if no key was found
+            anthropic_client: Anthropic client, or None if no key was found or not set up
+
+        Returns:
+            Names of the missing key variables; both when the model is unrecognized
+            and no key is configured at all, empty when nothing is missing
+        """
+        if provider == "openai":
+            return [] if openai_client else ["OPENAI_API_KEY"]
+        if provider == "anthropic":
+            return [] if anthropic_client else ["ANTHROPIC_API_KEY"]
+        if openai_client or os.getenv("ANTHROPIC_API_KEY"):
+            return []
+        return ["OPENAI_API_KEY", "ANTHROPIC_API_KEY"]
+
     @staticmethod
     def confirm(prompt: str) -> bool:
         """Ask for user confirmation."""
-        response = input(f"{prompt} (y/n): ").strip().lower()
-        return response == "y" or response == "yes"
+        return input(f"{prompt} (y/n): ").strip().lower() in _YES_ANSWERS
 
     @staticmethod
     def display_model_info() -> None:
@@ -341,6 +521,9 @@ class TranslatorCLI:
 
         console.print(table)
 
+        if ModelConfig.remote_models_disabled():
+            return
+
         # Try to fetch and display additional models from OpenAI API
         console.print("\n[bold]Fetching additional models from OpenAI API...[/]")
         try:
@@ -365,22 +548,30 @@ class TranslatorCLI:
             console.print(f"[yellow]Warning:[/] Could not fetch API models: {str(e)}")
             console.print("[dim]Showing locally configured models only.[/]")
 
+    @classmethod
+    def display_usage_table(cls, *args, **kwargs) -> None:
+        """Display the token usage table.
+
+        Takes the same arguments as build_usage_table().
+        """
+        console.print(cls.build_usage_table(*args, **kwargs))
+
     @staticmethod
-    def display_usage_table(
-        total_usage: Dict[str, int],
-        translation_usage: Dict[str, int],
-        edit_usage: Optional[Dict[str, int]] = None,
-        frontmatter_usage: Optional[Dict[str, int]] = None,
-        critique_usage: Optional[Dict[str, int]] = None,
-        feedback_usage: Optional[Dict[str, int]] = None,
-        critique_usages: Optional[List[Dict[str, int]]] = None,
-        feedback_usages: Optional[List[Dict[str, int]]] = None,
+    def build_usage_table(
+        total_usage: Usage,
+        translation_usage: Usage,
+        edit_usage: Optional[Usage] = None,
+        frontmatter_usage: Optional[Usage] = None,
+        critique_usage: Optional[Usage] = None,
+        feedback_usage: Optional[Usage] = None,
+        critique_usages: Optional[List[Usage]] = None,
+        feedback_usages: Optional[List[Usage]] = None,
         has_frontmatter: bool = False,
         skip_edit: bool = False,
         do_critique: bool = False,
         critique_loops: int = 1,
-    ) -> None:
-        """Display token usage table.
+    ) -> Table:
+        """Build the token usage table.
 
         Args:
             total_usage: Total token usage
@@ -395,6 +586,9 @@ class TranslatorCLI:
             skip_edit: Whether editing was skipped
             do_critique: Whether critique was performed
             critique_loops: Number of critique loops performed
+
+        Returns:
+            The token usage table, ready to print
         """
         usage_table = Table(title="Token Usage")
         usage_table.add_column("Operation", style="cyan")
@@ -402,83 +596,59 @@ class TranslatorCLI:
         usage_table.add_column("Output Tokens", style="green", justify="right")
         usage_table.add_column("Total Tokens", style="green", justify="right")
 
+        # Collect the operations that used tokens, then render them in one pass
+        rows: List[Tuple[str, Usage]] = []
+
+        def add_usage_row(label: str, usage: Optional[Usage]) -> None:
+            """Queue a row for an operation, skipping operations that used no tokens."""
+            if usage and usage.total_tokens > 0:
+                rows.append((label, usage))
+
         # Add frontmatter translation row if it happened
-        if (
-            has_frontmatter
-            and frontmatter_usage
-            and frontmatter_usage["total_tokens"] > 0
-        ):
-            usage_table.add_row(
-                "Frontmatter",
-                f"{frontmatter_usage['prompt_tokens']:,}",
-                f"{frontmatter_usage['completion_tokens']:,}",
-                f"{frontmatter_usage['total_tokens']:,}",
-            )
+        if has_frontmatter:
+            add_usage_row("Frontmatter", frontmatter_usage)
 
-        # Add content translation row
-        usage_table.add_row(
-            "Content Translation",
-            f"{translation_usage['prompt_tokens']:,}",
-            f"{translation_usage['completion_tokens']:,}",
-            f"{translation_usage['total_tokens']:,}",
-        )
+        # Content translation is always shown
+        rows.append(("Content Translation", translation_usage))
 
         # Add editing row if not skipped
-        if not skip_edit and edit_usage:
-            usage_table.add_row(
-                "Content Editing",
-                f"{edit_usage['prompt_tokens']:,}",
-                f"{edit_usage['completion_tokens']:,}",
-                f"{edit_usage['total_tokens']:,}",
-            )
+        if not skip_edit:
+            add_usage_row("Content Editing", edit_usage)
 
         # Add critique and feedback rows if performed
         if do_critique:
             # If we have multiple critique loops, show each one
-            if critique_usages and feedback_usages and len(critique_usages) > 0:
-                for i, (crit_usage, feed_usage) in enumerate(
-                    zip(critique_usages, feedback_usages)
-                ):
-                    if crit_usage and crit_usage["total_tokens"] > 0:
-                        usage_table.add_row(
-                            f"Critique Generation (Loop {i+1})",
-                            f"{crit_usage['prompt_tokens']:,}",
-                            f"{crit_usage['completion_tokens']:,}",
-                            f"{crit_usage['total_tokens']:,}",
-                        )
-                    if feed_usage and feed_usage["total_tokens"] > 0:
-                        usage_table.add_row(
-                            f"Critique Application (Loop {i+1})",
-                            f"{feed_usage['prompt_tokens']:,}",
-                            f"{feed_usage['completion_tokens']:,}",
-                            f"{feed_usage['total_tokens']:,}",
+            if critique_usages:
+                for i, crit_usage in enumerate(critique_usages):
+                    add_usage_row(f"Critique Generation (Loop {i+1})", crit_usage)
+                    # The last loop has no application when its critique found nothing to fix
+                    if feedback_usages and i < len(feedback_usages):
+                        add_usage_row(
+                            f"Critique Application (Loop {i+1})", feedback_usages[i]
                         )
             # Fallback to original behavior for backward compatibility
-            elif critique_usage and critique_usage["total_tokens"] > 0:
-                usage_table.add_row(
-                    "Critique Generation",
-                    f"{critique_usage['prompt_tokens']:,}",
-                    f"{critique_usage['completion_tokens']:,}",
-                    f"{critique_usage['total_tokens']:,}",
-                )
-                if feedback_usage and feedback_usage["total_tokens"] > 0:
-                    usage_table.add_row(
-                        "Critique Application",
-                        f"{feedback_usage['prompt_tokens']:,}",
-                        f"{feedback_usage['completion_tokens']:,}",
-                        f"{feedback_usage['total_tokens']:,}",
-                    )
+            elif critique_usage and critique_usage.total_tokens > 0:
+                add_usage_row("Critique Generation", critique_usage)
+                add_usage_row("Critique Application", feedback_usage)
+
+        for label, usage in rows:
+            usage_table.add_row(
+                label,
+                f"{usage.prompt_tokens:,}",
+                f"{usage.completion_tokens:,}",
+                f"{usage.total_tokens:,}",
+            )
 
         # Add total row
         usage_table.add_row(
             "Total",
-            f"{total_usage['prompt_tokens']:,}",
-            f"{total_usage['completion_tokens']:,}",
-            f"{total_usage['total_tokens']:,}",
+            f"{total_usage.prompt_tokens:,}",
+            f"{total_usage.completion_tokens:,}",
+            f"{total_usage.total_tokens:,}",
             style="bold",
         )
 
-        console.print(usage_table)
+        return usage_table
 
     @staticmethod
     def get_config_paths() -> list:
@@ -629,7 +799,6 @@ class TranslatorCLI:
         )
         
         # Check first argument to see if it's a known command
-        import sys
         first_arg = sys.argv[1] if len(sys.argv) > 1 else None
         
         # If the first argument is 'config', use command subparsers
@@ -682,6 +851,16 @@ class TranslatorCLI:
             action="store_true",
             help="Skip context gathering and run without user interaction",
         )
+        parser.add_argument(
+            "--pretty-log",
+            action="store_true",
+            help="Indent the JSON log file for reading (compact by default)",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Don't reuse or store cached model responses",
+        )
 
         args = parser.parse_args()
         
@@ -726,9 +905,13 @@ class TranslatorCLI:
 
         # Validate input file
         has_valid_input = True
-        if not Path(input_file).exists():
+        if not os.path.isfile(input_file):
+            if os.path.isdir(input_file):
+                problem = "is a directory, not a file"
+            else:
+                problem = "does not exist"
             console.print(
-                f"[bold red]Error:[/] Input file '{escape(input_file)}' does not exist."
+                f"[bold red]Error:[/] Input file '{escape(input_file)}' {problem}."
             )
             has_valid_input = False
 
@@ -745,10 +928,22 @@ class TranslatorCLI:
             headless,
         )
 
+    @staticmethod
+    def _is_markdown_file(input_file: str) -> bool:
+        """Check whether a file has a markdown extension.
+
+        Args:
+            input_file: Path to the input file
+
+        Returns:
+            True if the file extension is one of the markdown extensions
+        """
+        return os.path.splitext(input_file)[1].lower() in _MD_SUFFIXES
+
     @classmethod
     def _process_content(
         cls, input_file: str, content: str, model: str
-    ) -> Tuple[str, bool, Optional[Dict], Dict, str]:
+    ) -> Tuple[str, bool, Optional[Dict], Usage, str, int]:
         """Process input content and extract frontmatter if present.
 
         Args:
@@ -758,23 +953,23 @@ class TranslatorCLI:
 
         Returns:
             Tuple containing: content_for_translation, has_frontmatter,
-            frontmatter_data, frontmatter_usage, content_size_message
+            frontmatter_data, frontmatter_usage, content_size_message,
+            token_count (tokens in content_for_translation)
         """
         # Variables to track frontmatter
         has_frontmatter = False
         frontmatter_data = None
         content_without_frontmatter = None
-        frontmatter_usage = {
-            "prompt_tokens": 0,
-            "completion_tokens": 0,
-            "total_tokens": 0,
-        }
+        frontmatter_usage = Usage()
 
         # Check if file has frontmatter (for markdown blog posts)
-        if input_file.endswith((".md", ".markdown", ".mdx")):
-            has_frontmatter, frontmatter_data, content_without_frontmatter = (
-                FrontmatterHandler.parse_frontmatter(content)
-            )
+        if cls._is_markdown_file(input_file):
+            (
+                has_frontmatter,
+                frontmatter_data,
+                content_without_frontmatter,
+                raw_frontmatter,
+            ) = FrontmatterHandler.split_frontmatter(content)
 
             if has_frontmatter:
                 console.print(
@@ -782,11 +977,10 @@ class TranslatorCLI:
                 )
                 # Use content without frontmatter for token count
                 content_for_translation = content_without_frontmatter
-                frontmatter_str = frontmatter.dumps(
-                    frontmatter.Post("", **frontmatter_data)
-                ).split("---\n\n")[0]
-                frontmatter_token_count = TokenCounter.count_tokens(
-                    frontmatter_str, model
+                # Count the frontmatter as written rather than re-serializing it,
+                # in the same pass as the content itself
+                frontmatter_token_count, token_count = TokenCounter.count_many(
+                    [raw_frontmatter, content_for_translation], model
                 )
                 content_size_message = (
                     f"[bold]Frontmatter size:[/] {frontmatter_token_count:,} tokens"
@@ -798,12 +992,16 @@ class TranslatorCLI:
             content_for_translation = content
             content_size_message = ""
 
+        if not has_frontmatter:
+            token_count = TokenCounter.count_tokens(content_for_translation, model)
+
         return (
             content_for_translation,
             has_frontmatter,
             frontmatter_data,
             frontmatter_usage,
             content_size_message,
+            token_count,
         )
 
     @classmethod
@@ -817,6 +1015,7 @@ class TranslatorCLI:
         critique_loops: int,
         estimate_only: bool,
         headless: bool,
+        token_count: Optional[int] = None,
     ) -> Tuple[bool, int, float, str, bool]:
         """Check token limits and estimate cost.
 
@@ -829,9 +1028,11 @@ class TranslatorCLI:
             critique_loops: Number of critique loops to perform
             estimate_only: Whether to only estimate tokens and cost
             headless: Whether running in headless mode
+            token_count: Token count of content_for_translation if already known
 
         Returns:
             Tuple containing: within_limits, token_count, cost, cost_str, should_continue
+            (should_continue is always False when estimate_only is set)
         """
         # Check token limits
         within_limits, token_count = TokenCounter.check_token_limits(
@@ -840,6 +1041,7 @@ class TranslatorCLI:
             with_edit=not skip_edit,
             with_critique=do_critique,
             critique_loops=critique_loops,
+            token_count=token_count,
         )
         cost, cost_str = CostEstimator.estimate_cost(
             token_count, model, not skip_edit, do_critique, critique_loops
@@ -847,24 +1049,29 @@ class TranslatorCLI:
 
         # Display token and cost information
         console.print(
-            f"[bold]File size:[/] {len(content):,} characters, {token_count:,} tokens"
+            f"[bold]File size:[/] {len(content):,} characters, {token_count:,} tokens\n"
+            f"[bold]Estimated cost:[/] {cost_str}"
         )
-        console.print(f"[bold]Estimated cost:[/] {cost_str}")
+
+        if not within_limits and not headless:
+            console.print(
+                f"[bold red]Warning:[/] This text may exceed the {model} model's token limit."
+            )
+            console.print(
+                "Consider splitting the file into smaller parts or using a model with a higher token limit."
+            )
+
+        # Nothing left to decide when only estimating; the caller exits next
+        if estimate_only:
+            return within_limits, token_count, cost, cost_str, False
 
         should_continue = True
         if not within_limits:
-            if not headless:
-                console.print(
-                    f"[bold red]Warning:[/] This text may exceed the {model} model's token limit."
-                )
-                console.print(
-                    "Consider splitting the file into smaller parts or using a model with a higher token limit."
-                )
-            # Skip confirmation dialog when in estimate-only mode or headless mode
-            if not estimate_only and not headless and not cls.confirm("Continue anyway?"):
-                should_continue = False
-            elif headless and not estimate_only:
+            # Skip confirmation dialog in headless mode
+            if headless:
                 console.print("[dim]Running in headless mode - proceeding despite token limit warning.[/dim]")
+            elif not cls.confirm("Continue anyway?"):
+                should_continue = False
 
         return within_limits, token_count, cost, cost_str, should_continue
 
@@ -876,7 +1083,9 @@ class TranslatorCLI:
         translator: Translator,
         target_language: str,
         model: str,
-    ) -> Tuple[Optional[Dict], Dict, Dict]:
+        show_progress: bool = True,
+        cancellation: Optional[CancellationHandler] = None,
+    ) -> Tuple[Optional[Dict], Usage, Usage]:
         """
         Translates frontmatter fields if present and returns the translated data and token usage.
         
@@ -888,17 +1097,18 @@ class TranslatorCLI:
             translator: The Translator instance used for translation.
             target_language: The language to translate the frontmatter into.
             model: The model to use for translation.
+            show_progress: Whether to show a live token count. Disable this when
+                running alongside another live display, since only one can be
+                active at a time.
+            cancellation: Cancellation handler from a session the caller already
+                opened; if omitted, a new session is started for this request.
         
         Returns:
-            A tuple containing the translated frontmatter (or None if not present), a dictionary of token usage for the frontmatter translation, and a dictionary of total token usage.
+            A tuple containing the translated frontmatter (or None if not present), the token usage for the frontmatter translation, and the total token usage.
         """
         # Initialize usage tracking
-        total_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-        frontmatter_usage = {
-            "prompt_tokens": 0,
-            "completion_tokens": 0,
-            "total_tokens": 0,
-        }
+        total_usage = Usage()
+        frontmatter_usage = Usage()
 
         # Translate frontmatter if present
         translated_frontmatter = None
@@ -913,27 +1123,19 @@ class TranslatorCLI:
                     f"[bold]Translating frontmatter fields:[/] {', '.join(translatable_fields)}"
                 )
                 
-                # Use streaming for improved user experience
-                use_streaming = True
-                
-                if use_streaming:
-                    # Create token display
-                    token_display = StreamingTokenDisplay("Frontmatter Translation", model)
-                    
-                    # Define a callback to update the token counter
-                    def token_callback(_token):  # pylint: disable=unused-argument
-                        """
-                        Updates the streaming token display during token generation.
-                        
-                        This callback is intended to be passed to streaming translation or completion methods to refresh the live token count display each time a new token is received.
-                        """
-                        token_display.update()
-                    
-                    # Start the token display
+                # Create and start the token display
+                token_display = StreamingTokenDisplay("Frontmatter Translation", model)
+                if show_progress:
                     token_display.start()
-                    
-                    # Pass cancellation handler and reset it before starting
-                    cancellation.reset()
+                else:
+                    token_display.reset()
+                
+                session = (
+                    nullcontext(cancellation)
+                    if cancellation is not None
+                    else get_cancellation().session()
+                )
+                with session as cancellation:
                     translated_frontmatter, frontmatter_usage, error_msg = (
                         translator.translate_frontmatter(
                             frontmatter_data, 
@@ -942,34 +1144,24 @@ class TranslatorCLI:
                             model, 
                             stream=True,
                             cancellation_handler=cancellation,
-                            token_callback=token_callback
-                        )
-                    )
-                    
-                    # Stop the token display
-                    token_display.stop()
-                    
-                    # Show final count and elapsed time
-                    elapsed_time = token_display.get_elapsed_time()
-                    console.print(f"[bold green]Frontmatter translation complete![/] Generated [bold]{frontmatter_usage['completion_tokens']:,}[/] tokens in [bold magenta]{elapsed_time}[/]")
-                else:
-                    # Translate frontmatter fields without streaming
-                    translated_frontmatter, frontmatter_usage, error_msg = (
-                        translator.translate_frontmatter(
-                            frontmatter_data, translatable_fields, target_language, model, stream=False
+                            token_callback=token_display.update if show_progress else None
                         )
                     )
+                frontmatter_usage = Usage.from_dict(frontmatter_usage)
+                
+                # Stop the token display
+                token_display.stop()
+                
+                # Show final count and elapsed time
+                elapsed_time = token_display.get_elapsed_time()
+                console.print(f"[bold green]Frontmatter translation complete![/] Generated [bold]{frontmatter_usage.completion_tokens:,}[/] tokens in [bold magenta]{elapsed_time}[/]")
                 
                 # Handle any error
                 if error_msg:
                     console.print(f"[bold yellow]Warning:[/] {error_msg}")
 
                 # Add to total usage
-                total_usage["prompt_tokens"] += frontmatter_usage["prompt_tokens"]
-                total_usage["completion_tokens"] += frontmatter_usage[
-                    "completion_tokens"
-                ]
-                total_usage["total_tokens"] += frontmatter_usage["total_tokens"]
+                total_usage += frontmatter_usage
             else:
                 translated_frontmatter = frontmatter_data
 
@@ -982,8 +1174,10 @@ class TranslatorCLI:
         translator: Translator,
         target_language: str,
         model: str,
-        total_usage: Dict,
-    ) -> Tuple[str, Dict]:
+        total_usage: Usage,
+        token_display: Optional[StreamingTokenDisplay] = None,
+        cancellation: Optional[CancellationHandler] = None,
+    ) -> Tuple[str, Usage]:
         """
         Translates the main content using the specified model and updates token usage tracking.
         
@@ -991,67 +1185,49 @@ class TranslatorCLI:
             content_for_translation: The text content to be translated.
             target_language: The language to translate the content into.
             model: The OpenAI model to use for translation.
-            total_usage: Dictionary tracking cumulative token usage, updated in place.
+            total_usage: Cumulative token usage, updated in place.
+            token_display: Optional token display to reuse; a new one is created if omitted.
+            cancellation: Cancellation handler from a session the caller already
+                opened; if omitted, a new session is started for this request.
         
         Returns:
-            A tuple containing the translated content and a dictionary of token usage for this translation step.
+            A tuple containing the translated content and the token usage for this translation step.
         
         Exits the program if a translation error occurs.
         """
-        # Use streaming for improved user experience
-        use_streaming = True
+        # Custom progress display with token counter
+        console.print("[bold green]Translating...[/]")
         
-        if use_streaming:
-            # Custom progress display with token counter
-            console.print("[bold green]Translating...[/]")
-            
-            # Create token display
+        # Create or reuse the token display
+        if token_display is None:
             token_display = StreamingTokenDisplay("Translation", model)
-            
-            # Define a callback to update the token counter
-            def token_callback(_token):  # pylint: disable=unused-argument
-                """
-                Updates the streaming token display during token generation.
-                
-                This callback is intended to be passed to streaming translation operations to refresh
-                the live token count display each time a new token is received.
-                """
-                token_display.update()
-            
-            # Start the token display
-            token_display.start()
-            
-            # Pass cancellation handler and reset it before starting
-            cancellation.reset()
+        token_display.set_phase("Translation")
+        
+        # Start the token display
+        token_display.start()
+        
+        session = (
+            nullcontext(cancellation)
+            if cancellation is not None
+            else get_cancellation().session()
+        )
+        with session as cancellation:
             translated_content, translation_usage, error_msg = translator.translate_text(
                 content_for_translation, 
                 target_language, 
                 model, 
                 stream=True, 
                 cancellation_handler=cancellation,
-                token_callback=token_callback
+                token_callback=token_display.update
             )
-            
-            # Stop the token display
-            token_display.stop()
-            
-            # Show final count and elapsed time
-            elapsed_time = token_display.get_elapsed_time()
-            completion_tokens = translation_usage.get('completion_tokens', 0)
-            console.print(f"[bold green]Translation complete![/] Received [bold]{completion_tokens:,}[/] tokens in [bold magenta]{elapsed_time}[/]")
-        else:
-            # Traditional progress spinner (non-streaming)
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold green]Translating...[/]"),
-                transient=True,
-            ) as progress:
-                progress.add_task("translating", total=None)
-                
-                # Perform translation of main content and get token usage
-                translated_content, translation_usage, error_msg = translator.translate_text(
-                    content_for_translation, target_language, model, stream=False
-                )
+        
+        # Stop the token display
+        token_display.stop()
+        
+        # Show final count and elapsed time
+        elapsed_time = token_display.get_elapsed_time()
+        completion_tokens = translation_usage.get('completion_tokens', 0)
+        console.print(f"[bold green]Translation complete![/] Received [bold]{completion_tokens:,}[/] tokens in [bold magenta]{elapsed_time}[/]")
         
         # Handle any error
         if error_msg:
@@ -1059,9 +1235,8 @@ class TranslatorCLI:
             sys.exit(1)
             
         # Update usage tracking
-        total_usage["prompt_tokens"] += translation_usage["prompt_tokens"]
-        total_usage["completion_tokens"] += translation_usage["completion_tokens"]
-        total_usage["total_tokens"] += translation_usage["total_tokens"]
+        translation_usage = Usage.from_dict(translation_usage)
+        total_usage += translation_usage
 
         return translated_content, translation_usage
 
@@ -1074,8 +1249,9 @@ class TranslatorCLI:
         translator: Translator,
         target_language: str,
         model: str,
-        total_usage: Dict,
-    ) -> Tuple[str, Dict]:
+        total_usage: Usage,
+        token_display: Optional[StreamingTokenDisplay] = None,
+    ) -> Tuple[str, Usage]:
         """
         Edits the translated content for fluency and accuracy unless editing is skipped.
         
@@ -1087,39 +1263,28 @@ class TranslatorCLI:
             content_for_translation: The original untranslated content.
             target_language: The language into which the content is being translated.
             model: The model used for editing.
-            total_usage: Dictionary tracking cumulative token usage, updated in place.
+            total_usage: Cumulative token usage, updated in place.
+            token_display: Optional token display to reuse; a new one is created if omitted.
         
         Returns:
-            A tuple containing the (possibly edited) content and a dictionary of token usage for the editing step.
+            A tuple containing the (possibly edited) content and the token usage for the editing step.
         """
         # Initialize edit usage tracking
-        edit_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        edit_usage = Usage()
 
         # Perform editing if not skipped
         if not skip_edit:
             console.print("[bold]Editing translation for fluency and accuracy...[/]")
             
-            # Use streaming for improved user experience
-            use_streaming = True
-            
-            if use_streaming:
-                # Create token display
+            # Create or reuse the token display
+            if token_display is None:
                 token_display = StreamingTokenDisplay("Editing", model)
-                
-                # Define a callback to update the token counter
-                def token_callback(_token):  # pylint: disable=unused-argument
-                    """
-                    Updates the streaming token display during token generation.
-                    
-                    Intended as a callback for streaming token events to refresh the live token count UI.
-                    """
-                    token_display.update()
-                
-                # Start the token display
-                token_display.start()
-                
-                # Pass cancellation handler and reset it before starting
-                cancellation.reset()
+            token_display.set_phase("Editing")
+            
+            # Start the token display
+            token_display.start()
+            
+            with get_cancellation().session() as cancellation:
                 translated_content, edit_usage, error_msg = translator.edit_translation(
                     translated_content, 
                     content_for_translation, 
@@ -1127,37 +1292,23 @@ class TranslatorCLI:
                     model, 
                     stream=True,
                     cancellation_handler=cancellation,
-                    token_callback=token_callback
+                    token_callback=token_display.update
                 )
-                
-                # Stop the token display
-                token_display.stop()
-                
-                # Show final count and elapsed time
-                elapsed_time = token_display.get_elapsed_time()
-                console.print(f"[bold green]Editing complete![/] Processed [bold]{edit_usage['completion_tokens']:,}[/] tokens in [bold magenta]{elapsed_time}[/]")
-            else:
-                # Use Rich Progress bar for editing (non-streaming)
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[bold green]Editing translation...[/]"),
-                    transient=True,
-                ) as progress:
-                    progress.add_task("editing", total=None)
-                    
-                    # Perform editing without streaming
-                    translated_content, edit_usage, error_msg = translator.edit_translation(
-                        translated_content, content_for_translation, target_language, model, stream=False
-                    )
+            
+            # Stop the token display
+            token_display.stop()
+            
+            # Show final count and elapsed time
+            elapsed_time = token_display.get_elapsed_time()
+            console.print(f"[bold green]Editing complete![/] Processed [bold]{edit_usage.get('completion_tokens', 0):,}[/] tokens in [bold magenta]{elapsed_time}[/]")
             
             # Handle any error
             if error_msg:
                 console.print(f"[bold yellow]Warning:[/] {error_msg}")
                 
             # Update usage tracking
-            total_usage["prompt_tokens"] += edit_usage["prompt_tokens"]
-            total_usage["completion_tokens"] += edit_usage["completion_tokens"]
-            total_usage["total_tokens"] += edit_usage["total_tokens"]
+            edit_usage = Usage.from_dict(edit_usage)
+            total_usage += edit_usage
 
         return translated_content, edit_usage
 
@@ -1171,8 +1322,9 @@ class TranslatorCLI:
         translator: Translator,
         target_language: str,
         model: str,
-        total_usage: Dict,
-    ) -> Tuple[str, Dict, Dict, List[Dict], List[Dict]]:
+        total_usage: Usage,
+        token_display: Optional[StreamingTokenDisplay] = None,
+    ) -> Tuple[str, Usage, Usage, List[Usage], List[Usage]]:
         """
         Performs one or more critique and revision loops on translated content.
         
@@ -1185,56 +1337,45 @@ class TranslatorCLI:
             content_for_translation: The original source content.
             target_language: The language into which the content is being translated.
             model: The model used for critique and feedback.
-            total_usage: Dictionary tracking cumulative token usage.
+            total_usage: Cumulative token usage, updated in place.
+            token_display: Optional token display to reuse; a new one is created if omitted.
         
         Returns:
             A tuple containing:
                 - The improved content after all critique loops.
                 - Token usage for the last critique step.
                 - Token usage for the last feedback application.
-                - List of token usage dictionaries for each critique step.
-                - List of token usage dictionaries for each feedback application.
+                - List of token usages for each critique step.
+                - List of token usages for each feedback application.
         """
         # Initialize critique usage tracking
-        critique_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-        feedback_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        critique_usage = Usage()
+        feedback_usage = Usage()
 
         # Lists to track usage across multiple critique loops
         critique_usages = []
         feedback_usages = []
 
         if do_critique and critique_loops > 0:
-            # Store all critiques for logging
-            all_critiques = []
+            # Record critiques in the translator's log as they arrive, so the
+            # ones already generated are kept even if a later loop fails
+            all_critiques = translator.translation_log.setdefault("all_critiques", [])
+
+            # One token display for both steps, restarted for each of them
+            if token_display is None:
+                token_display = StreamingTokenDisplay("Critique Generation", model)
+            cancellation = get_cancellation()
 
             for loop in range(critique_loops):
                 # Generate critique for the current version
                 console.print(
                     f"[bold]Critique loop {loop+1}/{critique_loops}: Generating critique...[/]"
                 )
-                
-                # Use streaming for improved user experience
-                use_streaming = True
-                
-                if use_streaming:
-                    # Create token display
-                    token_display = StreamingTokenDisplay("Critique Generation", model)
-                    
-                    # Define a callback to update the token counter
-                    def token_callback(_token):  # pylint: disable=unused-argument
-                        """
-                        Updates the streaming token display during token generation.
-                        
-                        This callback is intended to be passed to streaming translation operations to refresh
-                        the live token count display each time a new token is received.
-                        """
-                        token_display.update()
-                    
-                    # Start the token display
-                    token_display.start()
-                    
-                    # Pass cancellation handler and reset it before starting
-                    cancellation.reset()
+
+                # Start the token display
+                token_display.set_phase("Critique Generation")
+                token_display.start()
+                with cancellation.session():
                     _, loop_critique_usage, critique_feedback, error_msg = (
                         translator.critique_translation(
                             translated_content,
@@ -1243,87 +1384,56 @@ class TranslatorCLI:
                             model,
                             stream=True,
                             cancellation_handler=cancellation,
-                            token_callback=token_callback
+                            token_callback=token_display.update
                         )
                     )
-                    
-                    # Stop the token display
-                    token_display.stop()
-                    
-                    # Show final count and elapsed time
-                    elapsed_time = token_display.get_elapsed_time()
-                    console.print(f"[bold green]Critique complete![/] Generated [bold]{loop_critique_usage['completion_tokens']:,}[/] tokens in [bold magenta]{elapsed_time}[/]")
-                else:
-                    # Use Rich Progress bar for critique generation (non-streaming)
-                    with Progress(
-                        SpinnerColumn(),
-                        TextColumn("[bold red]Generating critique...[/]"),
-                        transient=True,
-                    ) as progress:
-                        progress.add_task("critiquing", total=None)
-                        
-                        # Generate critique without streaming
-                        _, loop_critique_usage, critique_feedback, error_msg = (
-                            translator.critique_translation(
-                                translated_content,
-                                content_for_translation,
-                                target_language,
-                                model,
-                                stream=False
-                            )
-                        )
-                
+
+                # Stop the token display
+                token_display.stop()
+
+                # Show final count and elapsed time
+                elapsed_time = token_display.get_elapsed_time()
+                console.print(f"[bold green]Critique complete![/] Generated [bold]{loop_critique_usage.get('completion_tokens', 0):,}[/] tokens in [bold magenta]{elapsed_time}[/]")
+
                 # Handle any critique error
                 if error_msg:
                     console.print(f"[bold yellow]Warning:[/] {error_msg}")
                     continue
 
                 # Add usage to the running total
-                total_usage["prompt_tokens"] += loop_critique_usage["prompt_tokens"]
-                total_usage["completion_tokens"] += loop_critique_usage[
-                    "completion_tokens"
-                ]
-                total_usage["total_tokens"] += loop_critique_usage["total_tokens"]
+                loop_critique_usage = Usage.from_dict(loop_critique_usage)
+                total_usage += loop_critique_usage
 
                 # Store for reporting
                 critique_usages.append(loop_critique_usage)
                 all_critiques.append(critique_feedback)
 
                 # Show critique summary
-                critique_lines = critique_feedback.split("\n")
-                preview_lines = 10  # Show first 10 lines as a preview
-                console.print(f"[bold yellow]Critique summary (loop {loop+1}):[/]")
-                for i, line in enumerate(critique_lines[:preview_lines]):
-                    console.print(f"  {line}")
-                if len(critique_lines) > preview_lines:
+                # Show first 10 lines as a preview
+                critique_lines, remaining_lines = _preview_lines(critique_feedback, 10)
+                summary = [f"[bold yellow]Critique summary (loop {loop+1}):[/]"]
+                summary.extend(f"  {escape(line)}" for line in critique_lines)
+                if remaining_lines:
+                    summary.append(f"  [dim]...and {remaining_lines} more lines[/dim]")
+                console.print("\n".join(summary))
+
+                # Stop early rather than pay for applying (and re-critiquing)
+                # a critique that found nothing to fix
+                if not Translator.is_actionable_critique(critique_feedback):
                     console.print(
-                        f"  [dim]...and {len(critique_lines) - preview_lines} more lines[/dim]"
+                        "[bold green]No actionable issues found.[/] Skipping remaining critique loops."
                     )
+                    break
 
                 # Apply critique feedback
                 console.print(
                     f"[bold]Critique loop {loop+1}/{critique_loops}: Applying critique feedback...[/]"
                 )
-                
-                # Use streaming for improved user experience
-                use_streaming = True
-                
-                if use_streaming:
-                    # Create token display
-                    token_display = StreamingTokenDisplay("Critique Application", model)
-                    
-                    # Define a callback to update the token counter
-                    def token_callback(_token):  # pylint: disable=unused-argument
-                        """
-                        Updates the streaming token display when a new token is received during streaming operations.
-                        """
-                        token_display.update()
-                    
-                    # Start the token display
-                    token_display.start()
-                    
-                    # Pass cancellation handler and reset it before starting
-                    cancellation.reset()
+
+                # Start the token display
+                token_display.set_phase("Critique Application")
+                token_display.start()
+                with cancellation.session():
                     translated_content, loop_feedback_usage, error_msg = (
                         translator.apply_critique_feedback(
                             translated_content,
@@ -1333,65 +1443,31 @@ class TranslatorCLI:
                             model,
                             stream=True,
                             cancellation_handler=cancellation,
-                            token_callback=token_callback
+                            token_callback=token_display.update
                         )
                     )
-                    
-                    # Stop the token display
-                    token_display.stop()
-                    
-                    # Show final count and elapsed time
-                    elapsed_time = token_display.get_elapsed_time()
-                    console.print(f"[bold green]Critique application complete![/] Generated [bold]{loop_feedback_usage['completion_tokens']:,}[/] tokens in [bold magenta]{elapsed_time}[/]")
-                else:
-                    # Use Rich Progress bar for applying feedback (non-streaming)
-                    with Progress(
-                        SpinnerColumn(),
-                        TextColumn("[bold blue]Applying critique feedback...[/]"),
-                        transient=True,
-                    ) as progress:
-                        progress.add_task("applying_feedback", total=None)
-                        
-                        # Apply feedback without streaming
-                        translated_content, loop_feedback_usage, error_msg = (
-                            translator.apply_critique_feedback(
-                                translated_content,
-                                content_for_translation,
-                                critique_feedback,
-                                target_language,
-                                model,
-                                stream=False
-                            )
-                        )
-                
+
+                # Stop the token display
+                token_display.stop()
+
+                # Show final count and elapsed time
+                elapsed_time = token_display.get_elapsed_time()
+                console.print(f"[bold green]Critique application complete![/] Generated [bold]{loop_feedback_usage.get('completion_tokens', 0):,}[/] tokens in [bold magenta]{elapsed_time}[/]")
+
                 # Handle any feedback application error
                 if error_msg:
                     console.print(f"[bold yellow]Warning:[/] {error_msg}")
 
                 # Add usage to the running total
-                total_usage["prompt_tokens"] += loop_feedback_usage["prompt_tokens"]
-                total_usage["completion_tokens"] += loop_feedback_usage[
-                    "completion_tokens"
-                ]
-                total_usage["total_tokens"] += loop_feedback_usage["total_tokens"]
+                loop_feedback_usage = Usage.from_dict(loop_feedback_usage)
+                total_usage += loop_feedback_usage
 
                 # Store for reporting
                 feedback_usages.append(loop_feedback_usage)
 
             # For compatibility with existing code, store the last loop's usage in the original variables
-            critique_usage = (
-                critique_usages[-1]
-                if critique_usages
-                else {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-            )
-            feedback_usage = (
-                feedback_usages[-1]
-                if feedback_usages
-                else {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-            )
-
-            # Store all critiques in translator's log for logging
-            translator.translation_log["all_critiques"] = all_critiques
+            critique_usage = critique_usages[-1] if critique_usages else Usage()
+            feedback_usage = feedback_usages[-1] if feedback_usages else Usage()
 
         return (
             translated_content,
@@ -1409,20 +1485,23 @@ class TranslatorCLI:
         translated_content: str,
         input_file: str,
         target_language: str,
-        output_file: Optional[str],
-        total_usage: Dict,
+        output_path: str,
+        log_path: str,
+        narrative_path: str,
+        total_usage: Usage,
         model: str,
         translator: Translator,
         skip_edit: bool,
         do_critique: bool,
         critique_loops: int,
-        translation_usage: Dict,
-        edit_usage: Dict,
-        frontmatter_usage: Dict,
-        critique_usage: Dict,
-        feedback_usage: Dict,
-        critique_usages: List[Dict],
-        feedback_usages: List[Dict],
+        translation_usage: Usage,
+        edit_usage: Usage,
+        frontmatter_usage: Usage,
+        critique_usage: Usage,
+        feedback_usage: Usage,
+        critique_usages: List[Usage],
+        feedback_usages: List[Usage],
+        pretty_log: bool = False,
     ) -> None:
         """Finalize translation, save results, and display summary information.
 
@@ -1432,7 +1511,9 @@ class TranslatorCLI:
             translated_content: Translated content
             input_file: Path to the input file
             target_language: Target language for translation
-            output_file: Optional custom output file path
+            output_path: Path to write the translation to
+            log_path: Path to write the JSON log to
+            narrative_path: Path to write the narrative interpretation to
             total_usage: Total token usage
             model: Model used for translation
             translator: Translator instance
@@ -1446,6 +1527,7 @@ class TranslatorCLI:
             feedback_usage: Token usage for applying critique feedback
             critique_usages: List of token usages for multiple critique loops
             feedback_usages: List of token usages for multiple feedback loops
+            pretty_log: Whether to indent the JSON log file
         """
         # Reconstruct content with translated frontmatter if needed
         if has_frontmatter and translated_frontmatter:
@@ -1456,21 +1538,16 @@ class TranslatorCLI:
             final_content = translated_content
 
         # Calculate actual cost based on token usage
-        actual_cost, cost_str = CostEstimator.calculate_actual_cost(total_usage, model)
+        total_usage_dict = total_usage.to_dict()
+        actual_cost, cost_str = CostEstimator.calculate_actual_cost(total_usage_dict, model)
 
         # Write output file
-        output_path = FileHandler.get_output_filename(
-            input_file, target_language, output_file
-        )
         FileHandler.write_file(output_path, final_content)
 
-        # Get the language code used for the filename
-        from translator.language import LanguageHandler
-
+        # Get the language code used for the filename (cached by LanguageHandler)
         language_code = LanguageHandler.get_language_code(target_language)
 
         # Write translation log to a file
-        log_path = FileHandler.get_log_filename(output_path)
         log_data = {
             "input_file": input_file,
             "output_file": output_path,
@@ -1482,93 +1559,109 @@ class TranslatorCLI:
             "critique_loops": critique_loops,
             "has_frontmatter": has_frontmatter,
             "translation_context": translator.translation_context,
-            "token_usage": total_usage,
+            "token_usage": total_usage_dict,
             "cost": cost_str,
             "prompts_and_responses": translator.translation_log,
             # Include more detailed info for multiple critique loops
             "critique_loop_details": {
-                "critique_usages": critique_usages,
-                "feedback_usages": feedback_usages,
+                "critique_usages": [usage.to_dict() for usage in critique_usages],
+                "feedback_usages": [usage.to_dict() for usage in feedback_usages],
             },
         }
-        FileHandler.write_log(log_path, log_data)
-
-        # Display completion message with token usage and cost
-        console.print("[bold green]✓[/] Translation complete!")
-        console.print(
-            f"[bold]Target language:[/] {escape(target_language)} ({language_code})"
-        )
-        console.print(f"[bold]Output file:[/] {escape(output_path)}")
-        console.print(f"[bold]Log file:[/] {escape(log_path)}")
-
-        # Display token usage table
-        cls.display_usage_table(
-            total_usage=total_usage,
-            translation_usage=translation_usage,
-            edit_usage=edit_usage,
-            frontmatter_usage=frontmatter_usage,
-            critique_usage=critique_usage,
-            feedback_usage=feedback_usage,
-            critique_usages=critique_usages,
-            feedback_usages=feedback_usages,
-            has_frontmatter=has_frontmatter,
-            skip_edit=skip_edit,
-            do_critique=do_critique,
-            critique_loops=critique_loops,
-        )
-
-        console.print(f"[bold]Actual cost:[/] {cost_str}")
+        with get_cancellation().session() as cancellation:
+            # The narrative only needs the log data, so request it now and let
+            # the API call overlap with writing the log and printing the summary
+            # (from a shallow copy, since write_log adds a timestamp to log_data).
+            # It runs on a daemon thread so a forced exit doesn't wait for it,
+            # and streams so a first Ctrl+C stops it. Only generated if an
+            # OpenAI client is available.
+            narrative_call = None
+            if translator.openai_client:
+                log_interpreter = LogInterpreter(translator.openai_client)
+                narrative_call = BackgroundCall(
+                    log_interpreter.generate_narrative,
+                    dict(log_data),
+                    "o4-mini",
+                    stream=True,
+                    cancellation_handler=cancellation,
+                )
 
-        # Generate narrative interpretation (only if OpenAI client is available)
-        if translator.openai_client:
-            cls._generate_narrative(
-                client=translator.openai_client, log_data=log_data, output_path=output_path
+            FileHandler.write_log(log_path, log_data, pretty=pretty_log)
+
+            # Display completion message, token usage table and cost in one render
+            usage_table = cls.build_usage_table(
+                total_usage=total_usage,
+                translation_usage=translation_usage,
+                edit_usage=edit_usage,
+                frontmatter_usage=frontmatter_usage,
+                critique_usage=critique_usage,
+                feedback_usage=feedback_usage,
+                critique_usages=critique_usages,
+                feedback_usages=feedback_usages,
+                has_frontmatter=has_frontmatter,
+                skip_edit=skip_edit,
+                do_critique=do_critique,
+                critique_loops=critique_loops,
+            )
+            console.print(
+                # Text.assemble takes the values literally, so no markup parsing
+                # or escaping is needed
+                Group(
+                    Text.assemble(("✓", "bold green"), " Translation complete!"),
+                    Text.assemble(
+                        ("Target language:", "bold"), f" {target_language} ({language_code})"
+                    ),
+                    Text.assemble(("Output file:", "bold"), f" {output_path}"),
+                    Text.assemble(("Log file:", "bold"), f" {log_path}"),
+                    usage_table,
+                    Text.assemble(("Actual cost:", "bold"), f" {cost_str}"),
+                )
             )
 
+            if narrative_call is not None:
+                cls._generate_narrative(
+                    log_interpreter=log_interpreter,
+                    narrative_call=narrative_call,
+                    narrative_path=narrative_path,
+                )
+
     @classmethod
     def _generate_narrative(
-        cls, client: openai.OpenAI, log_data: Dict, output_path: str
+        cls,
+        log_interpreter: LogInterpreter,
+        narrative_call: BackgroundCall,
+        narrative_path: str,
     ) -> None:
-        """Generate and save a narrative interpretation of the translation process.
+        """Wait for the narrative interpretation of the translation process and save it.
 
         Args:
-            client: OpenAI client instance
-            log_data: Translation log data
-            output_path: Path to the output file
+            log_interpreter: Log interpreter that is generating the narrative
+            narrative_call: Pending call to LogInterpreter.generate_narrative()
+            narrative_path: Path to write the narrative to
         """
-        # Automatically generate a narrative interpretation of the log
+        # The narrative is generated in the background; wait for it here
         console.print(
             "[bold]Generating narrative interpretation of the translation process...[/]"
         )
-        log_interpreter = LogInterpreter(client)
-
-        # Generate the narrative (using non-streaming for this since it's less critical)
-        narrative = log_interpreter.generate_narrative(log_data, "o4-mini", stream=False)
-
-        # Get the narrative filename - format: filename.languagecode.log
-        base_parts = Path(output_path).stem.split(".")
-        if len(base_parts) >= 2:
-            # This handles the standard output format: filename.languagecode.ext
-            base = ".".join(base_parts[:2])  # Take filename and language code
-        else:
-            # Fallback for custom output paths
-            base = Path(output_path).stem
-
-        narrative_path = str(Path(output_path).parent / f"{base}.log")
+        narrative = narrative_call.result()
 
         # Write the narrative to a file
         log_interpreter.write_narrative(narrative_path, narrative)
 
-        console.print("[bold green]✓[/] Narrative interpretation generated!")
-        console.print(f"[bold]Narrative file:[/] {escape(narrative_path)}")
-
-        # Print a preview of the narrative
-        console.print("\n[bold]Narrative interpretation preview:[/]")
-        preview_lines = narrative.split("\n")[:5]  # First 5 lines
-        for line in preview_lines:
-            console.print(f"  {line}")
-        if len(narrative.split("\n")) > 5:
-            console.print("  [dim]...(see full narrative in the narrative file)[/dim]")
+        # Print the result and a preview of the narrative in one go
+        narrative_lines, remaining_lines = _preview_lines(narrative, 5)  # First 5 lines
+        preview = Text.assemble(
+            ("✓", "bold green"),
+            " Narrative interpretation generated!\n",
+            ("Narrative file:", "bold"),
+            f" {narrative_path}\n\n",
+            ("Narrative interpretation preview:", "bold"),
+        )
+        for line in narrative_lines:
+            preview.append(f"\n  {line}")
+        if remaining_lines:
+            preview.append("\n  ...(see full narrative in the narrative file)", style="dim")
+        console.print(preview)
 
     @classmethod
     def translate_file(
@@ -1582,6 +1675,8 @@ class TranslatorCLI:
         critique_loops: int,
         translator: Translator,
         headless: bool,
+        pretty_log: bool = False,
+        processed_content: Optional[Tuple[str, bool, Optional[Dict], Usage, str, int]] = None,
     ) -> Tuple[str, str, str]:
         """Translate a file to the target language.
 
@@ -1595,26 +1690,39 @@ class TranslatorCLI:
             critique_loops: Number of critique loops to perform
             translator: Translator instance
             headless: Whether running in headless mode
+            pretty_log: Whether to indent the JSON log file
+            processed_content: Result of _process_content() for input_file if the
+                caller already read and processed it; otherwise the file is read here
 
         Returns:
             Tuple containing: output_path, log_path, narrative_path
         """
-        console.print(f"[bold]Reading file:[/] {escape(input_file)}")
-        content = FileHandler.read_file(input_file)
+        read_here = processed_content is None
+        if read_here:
+            console.print(f"[bold]Reading file:[/] {escape(input_file)}")
+            content = FileHandler.read_file(input_file)
+
+            # Process content and extract frontmatter if present
+            processed_content = cls._process_content(input_file, content, model)
+            # Only the body is translated from here on; don't keep a second copy
+            # of the document alive for the rest of the run
+            del content
 
-        # Process content and extract frontmatter if present
         (
             content_for_translation,
             has_frontmatter,
             frontmatter_data,
             frontmatter_usage,
             content_size_message,
-        ) = cls._process_content(input_file, content, model)
-        if content_size_message:
+            token_count,
+        ) = processed_content
+        if read_here and content_size_message:
             console.print(content_size_message)
 
-        console.print(f"[bold]Translating to:[/] {escape(target_language)}")
-        console.print(f"[bold]Using model:[/] {escape(model)}")
+        console.print(
+            f"[bold]Translating to:[/] {escape(target_language)}\n"
+            f"[bold]Using model:[/] {escape(model)}"
+        )
         
         # Handle context gathering based on headless flag
         if headless:
@@ -1626,17 +1734,21 @@ class TranslatorCLI:
             console.print("[bold cyan]Please provide some context about the piece being translated.[/]")
             console.print("This could include information about the author, intended audience, tone, purpose, etc.")
             console.print("This context will help produce a more accurate and appropriate translation.")
-            console.print("(Press Enter twice to submit)")
-            
-            # Collect context input (allowing for multi-line input)
-            context_lines = []
-            while True:
-                line = input()
-                if not line and (not context_lines or not context_lines[-1]):
-                    break
-                context_lines.append(line)
-            
-            translation_context = "\n".join(context_lines).strip()
+            if sys.stdin.isatty():
+                console.print("(Press Enter twice to submit)")
+
+                # Collect context input (allowing for multi-line input)
+                context_lines = []
+                while True:
+                    line = input()
+                    if not line and (not context_lines or not context_lines[-1]):
+                        break
+                    context_lines.append(line)
+
+                translation_context = "\n".join(context_lines).strip()
+            else:
+                # Piped context: read it in one go rather than line by line
+                translation_context = sys.stdin.read().strip()
             
             # If context is provided, show confirmation
             if translation_context:
@@ -1647,17 +1759,55 @@ class TranslatorCLI:
                 console.print("[dim]No context provided. Proceeding with translation.[/dim]")
                 translator.translation_context = ""
 
-        # Translate frontmatter if present
-        translated_frontmatter, frontmatter_usage, total_usage = (
-            cls._translate_frontmatter(
-                has_frontmatter, frontmatter_data, translator, target_language, model
-            )
-        )
+        # One live token display, switched between the sequential phases
+        token_display = StreamingTokenDisplay("Translation", model)
 
-        # Translate main content
-        translated_content, translation_usage = cls._translate_content(
-            content_for_translation, translator, target_language, model, total_usage
-        )
+        if has_frontmatter and frontmatter_data:
+            # The frontmatter and content requests are independent, so translate
+            # the frontmatter in the background while the content streams
+            total_usage = Usage()
+            # Open one cancellation session for both requests here: signal
+            # handlers can only be installed from the main thread, and a single
+            # reset means neither request clears a Ctrl+C meant for the other
+            with get_cancellation().session() as cancellation:
+                # A daemon thread, so a forced exit doesn't wait for the
+                # frontmatter request; a first Ctrl+C stops its stream too
+                frontmatter_call = BackgroundCall(
+                    cls._translate_frontmatter,
+                    has_frontmatter,
+                    frontmatter_data,
+                    translator,
+                    target_language,
+                    model,
+                    show_progress=False,
+                    cancellation=cancellation,
+                )
+                translated_content, translation_usage = cls._translate_content(
+                    content_for_translation,
+                    translator,
+                    target_language,
+                    model,
+                    total_usage,
+                    token_display,
+                    cancellation=cancellation,
+                )
+                translated_frontmatter, frontmatter_usage, frontmatter_total = (
+                    frontmatter_call.result()
+                )
+            total_usage += frontmatter_total
+        else:
+            translated_frontmatter = None
+            total_usage = Usage()
+
+            # Translate main content
+            translated_content, translation_usage = cls._translate_content(
+                content_for_translation,
+                translator,
+                target_language,
+                model,
+                total_usage,
+                token_display,
+            )
 
         # Edit content if not skipped
         translated_content, edit_usage = cls._edit_content(
@@ -1668,6 +1818,7 @@ class TranslatorCLI:
             target_language,
             model,
             total_usage,
+            token_display,
         )
 
         # Perform critique loops if requested
@@ -1686,24 +1837,15 @@ class TranslatorCLI:
             target_language,
             model,
             total_usage,
+            token_display,
         )
 
-        # Calculate output paths before finalizing
+        # Calculate output paths once; finalizing and the narrative reuse them
         output_path = FileHandler.get_output_filename(
             input_file, target_language, output_file
         )
         log_path = FileHandler.get_log_filename(output_path)
-
-        # Get the narrative filename - format: filename.languagecode.log
-        base_parts = Path(output_path).stem.split(".")
-        if len(base_parts) >= 2:
-            # This handles the standard output format: filename.languagecode.ext
-            base = ".".join(base_parts[:2])  # Take filename and language code
-        else:
-            # Fallback for custom output paths
-            base = Path(output_path).stem
-
-        narrative_path = str(Path(output_path).parent / f"{base}.log")
+        narrative_path = FileHandler.get_narrative_filename(output_path)
 
         # Finalize translation, save results, and display summary
         cls._finalize_and_save(
@@ -1712,7 +1854,9 @@ class TranslatorCLI:
             translated_content,
             input_file,
             target_language,
-            output_file,
+            output_path,
+            log_path,
+            narrative_path,
             total_usage,
             model,
             translator,
@@ -1726,6 +1870,7 @@ class TranslatorCLI:
             feedback_usage,
             critique_usages,
             feedback_usages,
+            pretty_log,
         )
 
         return output_path, log_path, narrative_path
@@ -1767,13 +1912,15 @@ class TranslatorCLI:
         content = FileHandler.read_file(input_file)
 
         # Process content and extract frontmatter if present
+        processed_content = cls._process_content(input_file, content, model)
         (
             content_for_translation,
             has_frontmatter,
             frontmatter_data,
             frontmatter_usage,
             content_size_message,
-        ) = cls._process_content(input_file, content, model)
+            token_count,
+        ) = processed_content
         if content_size_message:
             console.print(content_size_message)
 
@@ -1788,35 +1935,53 @@ class TranslatorCLI:
                 critique_loops,
                 estimate_only,
                 headless,
+                token_count,
             )
         )
 
+        # Exit if only estimating or the user declined to continue
         if not should_continue:
             sys.exit(0)
 
-        # If only estimating, exit now
-        if estimate_only:
-            sys.exit(0)
+        # Only the processed body is needed from here on
+        del content
 
-        # Set up OpenAI and Anthropic clients
+        # Set up the OpenAI client (also used for the narrative summary) and
+        # only load the Anthropic SDK when the chosen model needs it
+        provider = ProviderFactory.get_provider_name(model)
         openai_client = cls.setup_openai_client()
-        anthropic_client = cls.setup_anthropic_client()
-
-        # Check that at least one client is available
-        if not openai_client and not anthropic_client:
-            console.print("[bold red]Error:[/] No API keys found. At least one API key is required.")
+        anthropic_client = None
+        if provider == "anthropic":
+            anthropic_client = cls.setup_anthropic_client()
+
+        # Check that the API key for the chosen model's provider is available
+        missing_keys = cls._missing_api_keys(provider, openai_client, anthropic_client)
+        if missing_keys:
+            if len(missing_keys) == 1:
+                console.print(
+                    f"[bold red]Error:[/] {missing_keys[0]} is required for model '{escape(model)}'."
+                )
+            else:
+                console.print("[bold red]Error:[/] No API keys found. At least one API key is required.")
             console.print("\nPlease configure your API keys using one of these methods:")
             console.print("1. Run: [bold cyan]translator config[/]")
             console.print("2. Set environment variables:")
-            console.print("   - export OPENAI_API_KEY=your_openai_api_key")
-            console.print("   - export ANTHROPIC_API_KEY=your_anthropic_api_key")
+            for key_name in missing_keys:
+                console.print(f"   - export {key_name}=your_{key_name.lower()}")
             console.print("3. Create a .env file in one of these locations:")
             console.print("   - Current directory")
             console.print("   - ~/.translator/.env")
             console.print("   - $XDG_CONFIG_HOME/translator/.env")
             sys.exit(1)
 
-        translator = Translator(openai_client=openai_client, anthropic_client=anthropic_client)
+        # Reuse responses from earlier identical runs unless disabled
+        response_cache = None if args.no_cache else ResponseCache()
+
+        translator = Translator(
+            openai_client=openai_client,
+            anthropic_client=anthropic_client,
+            response_cache=response_cache,
+        )
 
         # Translate the file
         cls.translate_file(
@@ -1829,4 +1994,6 @@ class TranslatorCLI:
             critique_loops,
             translator,
             headless,
+            pretty_log=args.pretty_log,
+            processed_content=processed_content,
         )
@@ -2,7 +2,10 @@
 # ABOUTME: Configuration for OpenAI models including token limits and pricing.
 # ABOUTME: Used for estimating costs and checking model capabilities.
 
-from typing import Dict, Any, List
+import json
+import os
+import time
+from typing import Dict, Any, List, Optional, Tuple
 
 
 class ModelConfig:
@@ -200,12 +203,21 @@ class ModelConfig:
         },
     }
 
+    # Configuration assumed for models missing from MODELS
+    DEFAULT_MODEL_INFO: Dict[str, Any] = {
+        "max_tokens": 4000,
+        "input_cost": 0.0,
+        "output_cost": 0.0,
+    }
+
     @classmethod
     def get_model_info(cls, model: str) -> Dict[str, Any]:
         """Get configuration for a specific model."""
-        return cls.MODELS.get(
-            model, {"max_tokens": 4000, "input_cost": 0.0, "output_cost": 0.0}
-        )
+        model_info = cls.MODELS.get(model)
+        if model_info is None:
+            # Hand out a copy so callers can't change the default for other models
+            return dict(cls.DEFAULT_MODEL_INFO)
+        return model_info
 
     @classmethod
     def get_max_tokens(cls, model: str) -> int:
@@ -227,13 +239,92 @@ class ModelConfig:
         """Get all available models and their configurations."""
         return cls.MODELS
 
+    # How long a fetched list of OpenAI API models is reused before refetching
+    API_MODELS_CACHE_TTL = 24 * 60 * 60
+
+    # Environment variable that, when set (to anything but "0"), turns off the
+    # OpenAI API model list entirely
+    DISABLE_REMOTE_MODELS_ENV = "TRANSLATOR_DISABLE_REMOTE_MODELS"
+
+    @staticmethod
+    def get_api_models_cache_path() -> str:
+        """Get the location of the cached OpenAI API model list.
+
+        Returns:
+            Path under $XDG_CACHE_HOME/translator (or ~/.cache/translator)
+        """
+        cache_home = os.environ.get(
+            "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+        )
+        return os.path.join(cache_home, "translator", "openai_models.json")
+
+    @classmethod
+    def _read_api_models_cache(cls) -> Tuple[Optional[List[str]], bool]:
+        """Read the cached OpenAI API model list.
+
+        Returns:
+            Tuple of (cached model list or None, whether it is still fresh)
+        """
+        cache_path = cls.get_api_models_cache_path()
+        try:
+            with open(cache_path, "r", encoding="utf-8") as file:
+                models = json.load(file)
+            age = time.time() - os.path.getmtime(cache_path)
+        except (OSError, ValueError):
+            return None, False
+        if not isinstance(models, list):
+            return None, False
+        return models, age < cls.API_MODELS_CACHE_TTL
+
+    @classmethod
+    def _write_api_models_cache(cls, models: List[str]) -> None:
+        """Store the OpenAI API model list, replacing any earlier copy atomically.
+
+        Args:
+            models: The model IDs to cache
+        """
+        cache_path = cls.get_api_models_cache_path()
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(models, file)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Caching is best-effort, but don't leave a partial file behind
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    @classmethod
+    def remote_models_disabled(cls) -> bool:
+        """Check whether fetching the OpenAI API model list has been turned off.
+
+        Returns:
+            True if the DISABLE_REMOTE_MODELS_ENV variable is set to anything but "0"
+        """
+        return os.environ.get(cls.DISABLE_REMOTE_MODELS_ENV, "") not in ("", "0")
+
     @classmethod
     def get_available_openai_models(cls) -> List[str]:
         """Get list of available models from OpenAI API.
 
+        The list is cached on disk for API_MODELS_CACHE_TTL seconds, and the last
+        fetched list is used if a refresh fails. Setting the environment variable
+        named by DISABLE_REMOTE_MODELS_ENV skips both the cache and the API.
+
         Returns:
-            List of model IDs available from OpenAI API, or empty list if API call fails.
+            List of model IDs available from OpenAI API, or empty list if API call fails
+            and nothing has been cached, or if remote models are disabled.
         """
+        if cls.remote_models_disabled():
+            return []
+
+        cached_models, fresh = cls._read_api_models_cache()
+        if fresh:
+            return cached_models
+
         try:
             import openai
             client = openai.OpenAI()
@@ -245,10 +336,13 @@ class ModelConfig:
                 # Include GPT models, o-series, and other chat models
                 if any(prefix in model_id for prefix in ['gpt-', 'o1-', 'o3-', 'o4-', 'chatgpt']):
                     chat_models.append(model_id)
-            return sorted(chat_models)
         except Exception:
-            # If API call fails, return empty list
-            return []
+            # If API call fails, fall back to the last fetched list (or nothing)
+            return cached_models or []
+
+        chat_models.sort()
+        cls._write_api_models_cache(chat_models)
+        return chat_models
 
     @classmethod
     def get_enhanced_model_list(cls) -> List[str]:
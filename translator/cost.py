@@ -65,28 +65,28 @@ class CostEstimator:
 
         # If critique is enabled, add its cost (both critique generation and application)
         if with_critique and critique_loops > 0:
-            for _ in range(critique_loops):
-                # Each critique loop includes:
-
-                # 1. For the critique generation, we input system prompt + original + translated text
-                critique_input_tokens = system_prompt_tokens + (token_count * 2)
-                # Critique output is typically longer than the translation (detailed feedback)
-                critique_output_tokens = int(token_count * 1.5)
-
-                # 2. For applying critique feedback, we input system prompt + original + translation + critique
-                feedback_input_tokens = system_prompt_tokens + (
-                    token_count * 3.5
-                )  # original + translation + critique feedback
-                # Output is similar to the translation
-                feedback_output_tokens = token_count
-
-                # Add critique generation and application costs for this loop
-                cost += (
-                    (critique_input_tokens / 1000) * input_cost
-                    + (critique_output_tokens / 1000) * output_cost
-                    + (feedback_input_tokens / 1000) * input_cost
-                    + (feedback_output_tokens / 1000) * output_cost
-                )
+            # Every critique loop costs the same, so price one and scale it.
+            # Each critique loop includes:
+
+            # 1. For the critique generation, we input system prompt + original + translated text
+            critique_input_tokens = system_prompt_tokens + (token_count * 2)
+            # Critique output is typically longer than the translation (detailed feedback)
+            critique_output_tokens = int(token_count * 1.5)
+
+            # 2. For applying critique feedback, we input system prompt + original + translation + critique
+            feedback_input_tokens = system_prompt_tokens + (
+                token_count * 3.5
+            )  # original + translation + critique feedback
+            # Output is similar to the translation
+            feedback_output_tokens = token_count
+
+            # Add critique generation and application costs for all loops
+            cost += critique_loops * (
+                (critique_input_tokens / 1000) * input_cost
+                + (critique_output_tokens / 1000) * output_cost
+                + (feedback_input_tokens / 1000) * input_cost
+                + (feedback_output_tokens / 1000) * output_cost
+            )
 
         # Format approximate price
         if cost < 0.01:
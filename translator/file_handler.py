@@ -2,7 +2,10 @@
 # ABOUTME: File input/output utilities for the translator.
 # ABOUTME: Provides functions to read, write, and generate output filenames.
 
+import json
+import os
 import sys
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -11,6 +14,12 @@ from rich.markup import escape
 
 from translator.language import LanguageHandler
 
+try:
+    import orjson
+except ImportError:
+    # Optional: faster serialization of large translation logs
+    orjson = None
+
 console = Console()
 
 
@@ -56,28 +65,50 @@ class FileHandler:
             sys.exit(1)
 
     @staticmethod
-    def write_log(log_path: str, log_data: dict) -> None:
+    def write_log(log_path: str, log_data: dict, pretty: bool = False) -> None:
         """Write detailed translation log to a file.
 
         Args:
             log_path: The path to the log file
             log_data: Dictionary containing the log data
+            pretty: Whether to indent the JSON (compact output is smaller and faster)
 
         Raises:
             SystemExit: If the log file cannot be written
         """
         try:
-            import json
-            from datetime import datetime
-
             # Add timestamp to the log
             log_data["timestamp"] = datetime.now().isoformat()
 
-            # Format the log content
-            log_content = json.dumps(log_data, indent=2, ensure_ascii=False)
-
-            with open(log_path, "w", encoding="utf-8") as file:
-                file.write(log_content)
+            # Format the log content as UTF-8 bytes; orjson produces them directly
+            if orjson is not None:
+                option = orjson.OPT_NON_STR_KEYS
+                if pretty:
+                    option |= orjson.OPT_INDENT_2
+                log_content = orjson.dumps(log_data, option=option)
+            elif pretty:
+                log_content = json.dumps(
+                    log_data, indent=2, ensure_ascii=False
+                ).encode("utf-8")
+            else:
+                log_content = json.dumps(
+                    log_data, separators=(",", ":"), ensure_ascii=False
+                ).encode("utf-8")
+
+            # Write to a temporary file and rename it into place, so an
+            # interrupted run never leaves a truncated log behind
+            tmp_path = f"{log_path}.tmp"
+            try:
+                with open(tmp_path, "wb") as file:
+                    file.write(log_content)
+                os.replace(tmp_path, log_path)
+            except Exception:
+                # Don't leave the partial temporary file next to the output
+                try:
+                    os.unlink(tmp_path)
+                except FileNotFoundError:
+                    pass
+                raise
         except Exception as e:
             console.print(
                 f"[bold yellow]Warning:[/] Failed to write log file: {escape(str(e))}"
@@ -124,3 +155,26 @@ class FileHandler:
         """
         output_path = Path(output_file)
         return str(output_path.with_suffix(f"{output_path.suffix}.log.json"))
+
+    @staticmethod
+    def get_narrative_filename(output_file: str) -> str:
+        """Generate narrative filename based on the output file.
+
+        The standard output format filename.languagecode.ext gives
+        filename.languagecode.log; other names just swap the extension.
+
+        Args:
+            output_file: The path to the output file
+
+        Returns:
+            The path to the narrative file
+        """
+        output_path = Path(output_file)
+        base = output_path.stem
+        # Keep only the filename and language code
+        first_dot = base.find(".")
+        if first_dot >= 0:
+            second_dot = base.find(".", first_dot + 1)
+            if second_dot >= 0:
+                base = base[:second_dot]
+        return str(output_path.parent / f"{base}.log")
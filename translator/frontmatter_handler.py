@@ -2,18 +2,39 @@
 # ABOUTME: Frontmatter parsing and handling for markdown files.
 # ABOUTME: Processes YAML frontmatter in blog posts and static site content.
 
+import re
 from typing import Dict, List, Optional, Tuple
 
-import frontmatter
 from rich.console import Console
 from rich.markup import escape
 
 console = Console()
 
+# Frontmatter must open with a delimiter ("---" for YAML, "+++" for TOML,
+# "{" for JSON) once leading whitespace is skipped
+_LEADING_WHITESPACE = re.compile(r"\s*")
+_FRONTMATTER_OPENERS = ("-", "+", "{")
+
 
 class FrontmatterHandler:
     """Frontmatter parsing and handling for markdown files."""
 
+    # Common translatable fields in various static site generators
+    TRANSLATABLE_FIELDS = (
+        "title",
+        "description",
+        "summary",
+        "excerpt",
+        "subtitle",
+        "seo_title",
+        "seo_description",
+        "meta_description",
+        "abstract",
+        "intro",
+        "heading",
+        "subheading",
+    )
+
     @staticmethod
     def parse_frontmatter(content: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """Parse frontmatter from content using python-frontmatter.
@@ -27,24 +48,68 @@ class FrontmatterHandler:
                 - Dictionary containing the frontmatter data if found, otherwise None
                 - String containing the content without frontmatter if found, otherwise None
         """
+        has_frontmatter, metadata, content_without_frontmatter, _ = (
+            FrontmatterHandler.split_frontmatter(content)
+        )
+        return has_frontmatter, metadata, content_without_frontmatter
+
+    @staticmethod
+    def split_frontmatter(
+        content: str,
+    ) -> Tuple[bool, Optional[Dict], Optional[str], Optional[str]]:
+        """Parse frontmatter from content and also return the raw frontmatter block.
+
+        The raw block is the slice of the original content in front of the body
+        (delimiters included), so callers can measure it without re-serializing
+        the parsed metadata.
+
+        Args:
+            content: The content to parse
+
+        Returns:
+            Tuple containing:
+                - Boolean indicating if frontmatter was detected
+                - Dictionary containing the frontmatter data if found, otherwise None
+                - String containing the content without frontmatter if found, otherwise None
+                - String containing the raw frontmatter block if found, otherwise None
+        """
+        # Most documents have no frontmatter; rule that out from the first
+        # non-whitespace character instead of letting python-frontmatter strip
+        # a copy of the whole document first
+        start = _LEADING_WHITESPACE.match(content).end()
+        if not content.startswith(_FRONTMATTER_OPENERS, start):
+            return False, None, None, None
+
+        # python-frontmatter pulls in YAML and TOML parsers, so only load it
+        # once there is a document to parse
+        import frontmatter
+
         try:
             # Parse content with frontmatter
             post = frontmatter.loads(content)
 
             # Check if frontmatter was found
             if post.metadata:
-                # Extract metadata and content
-                metadata = dict(post.metadata)
+                # Extract metadata and content; the Post is discarded, so its
+                # metadata dict can be handed over without copying
+                metadata = post.metadata
                 content_without_frontmatter = post.content
-                return True, metadata, content_without_frontmatter
+                # The parsed body is a suffix of the original up to trailing
+                # whitespace; find its end by index rather than via rstrip(),
+                # which would copy the whole document
+                end = len(content)
+                while end and content[end - 1].isspace():
+                    end -= 1
+                raw_frontmatter = content[: end - len(content_without_frontmatter)]
+                return True, metadata, content_without_frontmatter, raw_frontmatter
             else:
                 # No frontmatter found
-                return False, None, None
+                return False, None, None, None
         except Exception as e:
             console.print(
                 f"[bold yellow]Warning:[/] Failed to parse frontmatter: {escape(str(e))}"
             )
-            return False, None, None
+            return False, None, None, None
 
     @staticmethod
     def get_translatable_frontmatter_fields(frontmatter_data: Dict) -> List[str]:
@@ -56,25 +121,13 @@ class FrontmatterHandler:
         Returns:
             A list of field names that should be translated
         """
-        # Common translatable fields in various static site generators
-        translatable_fields = [
-            "title",
-            "description",
-            "summary",
-            "excerpt",
-            "subtitle",
-            "seo_title",
-            "seo_description",
-            "meta_description",
-            "abstract",
-            "intro",
-            "heading",
-            "subheading",
+        # Return only fields that exist in the frontmatter, in a fixed order
+        return [
+            field
+            for field in FrontmatterHandler.TRANSLATABLE_FIELDS
+            if field in frontmatter_data
         ]
 
-        # Return only fields that exist in the frontmatter
-        return [field for field in translatable_fields if field in frontmatter_data]
-
     @staticmethod
     def reconstruct_with_frontmatter(metadata: Dict, content: str) -> str:
         """Reconstruct content with frontmatter using python-frontmatter.
@@ -86,6 +139,8 @@ class FrontmatterHandler:
         Returns:
             The reconstructed content with frontmatter
         """
+        import frontmatter
+
         # Create a new post object with metadata and content
         post = frontmatter.Post(content, **metadata)
 
@@ -3,10 +3,9 @@
 # ABOUTME: Maps language names to standardized codes for file naming.
 
 import re
+from functools import lru_cache
 from typing import Dict
 
-import pycountry
-
 
 class LanguageHandler:
     """Language code utilities for handling ISO-639 language codes."""
@@ -54,9 +53,13 @@ class LanguageHandler:
     }
 
     @classmethod
+    @lru_cache(maxsize=256)
     def get_language_code(cls, language_name: str) -> str:
         """Convert a language name to ISO 639-1 two-letter code.
 
+        Results are cached, since names missing from LANGUAGE_CODES fall
+        back to scanning every language pycountry knows about.
+
         Args:
             language_name: The name of the language to convert
 
@@ -72,7 +75,10 @@ class LanguageHandler:
         if language_name_normalized in cls.LANGUAGE_CODES:
             return cls.LANGUAGE_CODES[language_name_normalized]
 
-        # Try with pycountry
+        # Try with pycountry, which is slow to import, so only load it for
+        # names the direct mapping doesn't cover
+        import pycountry
+
         try:
             # Try to find by name
             lang = pycountry.languages.get(name=language_name_normalized.title())
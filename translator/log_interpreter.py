@@ -4,19 +4,27 @@
 
 import json
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-import openai
 from rich.console import Console
 from rich.markup import escape
 
+if TYPE_CHECKING:
+    import openai
+
+try:
+    import orjson
+except ImportError:
+    # Optional: faster parsing of large translation logs
+    orjson = None
+
 console = Console()
 
 
 class LogInterpreter:
     """Interprets translation log files and generates narrative summaries."""
 
-    def __init__(self, client: openai.OpenAI):
+    def __init__(self, client: "openai.OpenAI"):
         """Initialize the log interpreter.
 
         Args:
@@ -35,8 +43,11 @@ class LogInterpreter:
             Parsed log data as a dictionary, or None if the file cannot be read or parsed
         """
         try:
-            with open(log_path, "r", encoding="utf-8") as file:
-                return json.loads(file.read())
+            with open(log_path, "rb") as file:
+                data = file.read()
+            if orjson is not None:
+                return orjson.loads(data)
+            return json.loads(data)
         except (FileNotFoundError, json.JSONDecodeError, IOError) as e:
             console.print(
                 f"[bold red]Error:[/] Failed to read or parse log file: {escape(str(e))}"
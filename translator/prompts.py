@@ -124,6 +124,7 @@ List specific issues and suggestions for improvement, organized by severity and
 Your critique should be detailed enough for another translator to address all the issues.
 
 Your goal is to help create a perfect translation that reads as if originally written in {target_language} while being 100% faithful to the source.
+If the translation has no issues worth fixing, reply with only "NO ISSUES".
 """
 
     @staticmethod
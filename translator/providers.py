@@ -3,13 +3,14 @@
 # ABOUTME: Supports OpenAI and Anthropic models with unified interface.
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Tuple
-
-import openai
-import anthropic
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 from translator.config import ModelConfig
 
+if TYPE_CHECKING:
+    import anthropic
+    import openai
+
 
 class AIProvider(ABC):
     """Abstract base class for AI providers."""
@@ -37,7 +38,7 @@ class AIProvider(ABC):
 class OpenAIProvider(AIProvider):
     """OpenAI API provider implementation."""
 
-    def __init__(self, client: openai.OpenAI):
+    def __init__(self, client: "openai.OpenAI"):
         self.client = client
 
     def translate_text(
@@ -131,7 +132,7 @@ class OpenAIProvider(AIProvider):
 class AnthropicProvider(AIProvider):
     """Anthropic Claude API provider implementation."""
 
-    def __init__(self, client: anthropic.Anthropic):
+    def __init__(self, client: "anthropic.Anthropic"):
         self.client = client
 
     def translate_text(
@@ -227,6 +228,25 @@ class AnthropicProvider(AIProvider):
 class ProviderFactory:
     """Factory for creating appropriate AI providers."""
 
+    @staticmethod
+    def get_provider_name(model: str) -> Optional[str]:
+        """Determine which provider serves the given model.
+
+        Args:
+            model: Model name (supports prefixes like "openai:gpt-4" or "anthropic:claude-3")
+
+        Returns:
+            "openai" or "anthropic", or None if the model is not supported
+        """
+        # Parse model prefix if present (e.g., "openai:gpt-4" -> "openai", "gpt-4")
+        if ":" in model:
+            provider_prefix = model.split(":", 1)[0].lower()
+            return provider_prefix if provider_prefix in ("openai", "anthropic") else None
+
+        # Fall back to existing detection logic for backward compatibility
+        provider = ModelConfig.get_provider(model)
+        return provider if provider in ("openai", "anthropic") else None
+
     @staticmethod
     def create_provider(model: str, openai_client=None, anthropic_client=None) -> AIProvider:
         """Create the appropriate provider for the given model.
@@ -242,25 +262,17 @@ class ProviderFactory:
         Raises:
             ValueError: If model is not supported or required client is missing
         """
-        # Parse model prefix if present (e.g., "openai:gpt-4" -> "openai", "gpt-4")
-        if ":" in model:
-            provider_prefix, model_name = model.split(":", 1)
-            provider_prefix = provider_prefix.lower()
-        else:
-            # Fall back to existing detection logic for backward compatibility
-            provider_prefix = None
-            model_name = model
+        provider_name = ProviderFactory.get_provider_name(model)
 
-        # Determine provider based on prefix or model detection
-        if provider_prefix == "openai" or (provider_prefix is None and ModelConfig.is_openai_model(model_name)):
+        if provider_name == "openai":
             if openai_client is None:
                 raise ValueError("OpenAI client required for OpenAI models")
             return OpenAIProvider(openai_client)
 
-        elif provider_prefix == "anthropic" or (provider_prefix is None and ModelConfig.is_anthropic_model(model_name)):
+        elif provider_name == "anthropic":
             if anthropic_client is None:
                 raise ValueError("Anthropic client required for Anthropic models")
             return AnthropicProvider(anthropic_client)
 
         else:
-            raise ValueError(f"Unsupported model: {model}")
\ No newline at end of file
+            raise ValueError(f"Unsupported model: {model}")
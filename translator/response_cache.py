@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# ABOUTME: Persistent on-disk cache of model responses for the translator.
+# ABOUTME: Stores responses in SQLite keyed by a hash of the request contents.
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Optional, Tuple
+
+from rich.console import Console
+from rich.markup import escape
+
+console = Console()
+
+
+class ResponseCache:
+    """Persistent cache of model responses stored in a SQLite database.
+
+    Entries are keyed by a SHA-256 hash of everything that determines a
+    response (phase, model, target language, system prompt and input text),
+    so re-running the same translation skips the API calls entirely.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the response cache.
+
+        Args:
+            path: Path to the SQLite database file (defaults to the user cache directory)
+        """
+        self.path = path or self.default_path()
+        self._conn = None
+        self._lock = threading.Lock()
+        self._disabled = False
+
+    @staticmethod
+    def default_path() -> str:
+        """Get the default location of the cache database.
+
+        Returns:
+            Path to the cache database under $XDG_CACHE_HOME/translator (or ~/.cache/translator)
+        """
+        cache_home = os.environ.get(
+            "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+        )
+        return os.path.join(cache_home, "translator", "responses.sqlite3")
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from the parts of a request.
+
+        Args:
+            parts: The values that determine the response
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(parts, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use.
+
+        Returns:
+            The database connection, or None if the cache is unavailable
+        """
+        if self._conn is None and not self._disabled:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, response TEXT NOT NULL, usage TEXT NOT NULL)"
+                )
+                conn.commit()
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                console.print(
+                    f"[bold yellow]Warning:[/] Response cache unavailable: {escape(str(e))}"
+                )
+                self._disabled = True
+        return self._conn
+
+    def get(self, key: str) -> Optional[Tuple[str, Dict]]:
+        """Look up a cached response.
+
+        Args:
+            key: The cache key from make_key()
+
+        Returns:
+            Tuple of (response, usage) if cached, otherwise None
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT response, usage FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def set(self, key: str, response: str, usage: Dict) -> None:
+        """Store a response in the cache.
+
+        Args:
+            key: The cache key from make_key()
+            response: The response text
+            usage: Token usage reported for the response
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, usage) VALUES (?, ?, ?)",
+                    (key, response, json.dumps(usage)),
+                )
+                conn.commit()
+            except sqlite3.Error:
+                # Caching is best-effort
+                pass
@@ -2,7 +2,7 @@
 # ABOUTME: Token counting utilities for estimating OpenAI API usage.
 # ABOUTME: Provides functions to count tokens and check token limits.
 
-from typing import Tuple
+from typing import List, Optional, Tuple
 from functools import lru_cache
 
 import tiktoken
@@ -30,6 +30,23 @@ class TokenCounter:
             # Fallback to cl100k_base if model-specific encoding not found
             return tiktoken.get_encoding("cl100k_base")
 
+    @classmethod
+    def _encoding_for(cls, model: str):
+        """Get the cached encoding used to count tokens for a model.
+
+        Args:
+            model: The model name to get the encoding for
+
+        Returns:
+            The encoding for the specified model
+        """
+        # Use gpt-4 encoder for o3 model
+        model_name = model
+        if model == "o3":
+            model_name = "gpt-4"
+
+        return cls._get_encoding(model_name)
+
     @classmethod
     def count_tokens(cls, text: str, model: str) -> int:
         """Count the number of tokens in a text string for a specific model.
@@ -41,13 +58,22 @@ class TokenCounter:
         Returns:
             The number of tokens in the text
         """
-        # Use gpt-4 encoder for o3 model
-        model_name = model
-        if model == "o3":
-            model_name = "gpt-4"
+        # Special tokens are counted as plain text rather than rejected
+        return len(cls._encoding_for(model).encode(text, disallowed_special=()))
+
+    @classmethod
+    def count_many(cls, texts: List[str], model: str) -> List[int]:
+        """Count tokens for several text strings with a single encoder lookup.
+
+        Args:
+            texts: The texts to count tokens for
+            model: The model name to use for counting
 
-        encoding = cls._get_encoding(model_name)
-        return len(encoding.encode(text))
+        Returns:
+            The number of tokens in each text, in the same order
+        """
+        encoding = cls._encoding_for(model)
+        return [len(encoding.encode(text, disallowed_special=())) for text in texts]
 
     @classmethod
     def check_token_limits(
@@ -57,6 +83,7 @@ class TokenCounter:
         with_edit: bool = True,
         with_critique: bool = True,
         critique_loops: int = 4,
+        token_count: Optional[int] = None,
     ) -> Tuple[bool, int]:
         """Check if content is within token limits for the model.
 
@@ -66,13 +93,16 @@ class TokenCounter:
             with_edit: Whether editing will be performed
             with_critique: Whether critique will be performed
             critique_loops: Number of critique loops planned
+            token_count: Token count of the content if already known, which
+                skips encoding the content again
 
         Returns:
             Tuple containing:
                 - Boolean indicating if the content is within limits
                 - The token count
         """
-        token_count = cls.count_tokens(content, model)
+        if token_count is None:
+            token_count = cls.count_tokens(content, model)
 
         # Get max tokens for the model
         max_tokens = ModelConfig.get_max_tokens(model)
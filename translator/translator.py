@@ -3,13 +3,15 @@
 # ABOUTME: Provides translation, editing, and critique functions.
 
 import re
-from typing import Dict, List, Optional, Tuple
-
-import openai
-import anthropic
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from translator.prompts import Prompts
 from translator.providers import ProviderFactory
+from translator.response_cache import ResponseCache
+
+if TYPE_CHECKING:
+    import anthropic
+    import openai
 
 
 class Translator:
@@ -25,15 +27,26 @@ class Translator:
     3. Possibility of cancelling long-running requests
     """
 
-    def __init__(self, openai_client: openai.OpenAI = None, anthropic_client: anthropic.Anthropic = None):
+    # Short critique replies that mean there is nothing to fix
+    NO_ISSUES_PATTERN = re.compile(r"\s*(no issues|looks good|lgtm)\b", re.IGNORECASE)
+    NO_ISSUES_MAX_LENGTH = 32
+
+    def __init__(
+        self,
+        openai_client: "openai.OpenAI" = None,
+        anthropic_client: "anthropic.Anthropic" = None,
+        response_cache: Optional[ResponseCache] = None,
+    ):
         """Initialize the translator.
 
         Args:
             openai_client: OpenAI client instance
             anthropic_client: Anthropic client instance
+            response_cache: Optional persistent cache of model responses
         """
         self.openai_client = openai_client
         self.anthropic_client = anthropic_client
+        self.response_cache = response_cache
         self.translation_context = ""
         self.translation_log = {
             "translation": {},
@@ -44,6 +57,71 @@ class Translator:
             "all_critiques": [],
         }
 
+    def _complete(
+        self,
+        provider,
+        phase: str,
+        text: str,
+        target_language: str,
+        model: str,
+        system_prompt: str,
+        stream: bool,
+        cancellation_handler,
+        token_callback,
+    ) -> Tuple[Optional[str], Dict, Optional[str]]:
+        """
+        Sends a request to the provider, serving it from the response cache when possible.
+
+        Cache hits skip the API call and report zero token usage, since nothing is billed. Only complete, successful responses are stored.
+
+        Args:
+            provider: The provider to send the request to on a cache miss.
+            phase: The pipeline phase making the request (e.g. "translation", "editing").
+            text: The text to send.
+            target_language: The language to translate into.
+            model: The model to use.
+            system_prompt: The system prompt to use.
+            stream: If True, streams the response incrementally.
+            cancellation_handler: Optional handler to interrupt streaming if cancellation is requested.
+            token_callback: Optional function called with each token during streaming.
+
+        Returns:
+            A tuple containing the response text (or None), a dictionary with usage statistics, and an error message (or None).
+        """
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = ResponseCache.make_key(
+                phase, model, target_language, system_prompt, text
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                empty_usage = {
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
+                }
+                return cached[0], empty_usage, None
+
+        response, usage, error = provider.translate_text(
+            text=text,
+            target_language=target_language,
+            model=model,
+            system_prompt=system_prompt,
+            stream=stream,
+            cancellation_handler=cancellation_handler,
+            token_callback=token_callback
+        )
+
+        # Don't cache failed or cancelled (partial) responses
+        cancelled = (
+            cancellation_handler is not None
+            and cancellation_handler.is_cancellation_requested()
+        )
+        if cache_key is not None and response and not error and not cancelled:
+            self.response_cache.set(cache_key, response, usage)
+
+        return response, usage, error
+
     def translate_text(
         self, text: str, target_language: str, model: str, stream: bool = False,
         cancellation_handler=None, token_callback=None
@@ -76,14 +154,16 @@ class Translator:
                 anthropic_client=self.anthropic_client
             )
 
-            translated_text, usage, error = provider.translate_text(
-                text=text,
-                target_language=target_language,
-                model=model,
-                system_prompt=system_prompt,
-                stream=stream,
-                cancellation_handler=cancellation_handler,
-                token_callback=token_callback
+            translated_text, usage, error = self._complete(
+                provider,
+                "translation",
+                text,
+                target_language,
+                model,
+                system_prompt,
+                stream,
+                cancellation_handler,
+                token_callback,
             )
 
             # Log the translation prompts and response
@@ -153,14 +233,16 @@ class Translator:
             # Create custom prompt that combines user and text content
             edit_text = f"Edit this translation to improve fluency and accuracy:\n\nOriginal: {original_text}\n\nTranslation: {translated_text}"
 
-            edited_text, usage, error = provider.translate_text(
-                text=edit_text,
-                target_language=target_language,
-                model=model,
-                system_prompt=system_prompt,
-                stream=stream,
-                cancellation_handler=cancellation_handler,
-                token_callback=token_callback
+            edited_text, usage, error = self._complete(
+                provider,
+                "editing",
+                edit_text,
+                target_language,
+                model,
+                system_prompt,
+                stream,
+                cancellation_handler,
+                token_callback,
             )
 
             # Log the editing prompts and response
@@ -183,6 +265,28 @@ class Translator:
             # Return original translation if editing fails with empty usage stats
             return translated_text, empty_usage, error_msg
 
+    @classmethod
+    def is_actionable_critique(cls, critique_feedback: str) -> bool:
+        """Check whether a critique contains feedback worth applying.
+
+        Empty critiques and short replies such as "NO ISSUES" or "Looks good."
+        are not actionable. Longer replies are always treated as actionable,
+        since they may start with "No issues" and go on to list some.
+
+        Args:
+            critique_feedback: The critique text
+
+        Returns:
+            True if the critique should be applied, False otherwise
+        """
+        stripped = critique_feedback.strip()
+        if not stripped:
+            return False
+        return not (
+            len(stripped) < cls.NO_ISSUES_MAX_LENGTH
+            and cls.NO_ISSUES_PATTERN.match(stripped)
+        )
+
     def critique_translation(
         self, translated_text: str, original_text: str, target_language: str, model: str,
         stream: bool = False, cancellation_handler=None, token_callback=None
@@ -227,14 +331,16 @@ class Translator:
             # Create critique text that includes both original and translation
             critique_text = f"Critique this translation:\n\nOriginal: {original_text}\n\nTranslation: {translated_text}"
 
-            critique_feedback, usage, error = provider.translate_text(
-                text=critique_text,
-                target_language=target_language,
-                model=model,
-                system_prompt=system_prompt,
-                stream=stream,
-                cancellation_handler=cancellation_handler,
-                token_callback=token_callback
+            critique_feedback, usage, error = self._complete(
+                provider,
+                "critique",
+                critique_text,
+                target_language,
+                model,
+                system_prompt,
+                stream,
+                cancellation_handler,
+                token_callback,
             )
 
             # Log the critique prompts and response
@@ -310,14 +416,16 @@ class Translator:
             # Create feedback text that includes original, translation, and critique
             feedback_text = f"Apply this feedback to improve the translation:\n\nOriginal: {original_text}\n\nTranslation: {translated_text}\n\nFeedback: {critique_feedback}"
 
-            improved_text, usage, error = provider.translate_text(
-                text=feedback_text,
-                target_language=target_language,
-                model=model,
-                system_prompt=system_prompt,
-                stream=stream,
-                cancellation_handler=cancellation_handler,
-                token_callback=token_callback
+            improved_text, usage, error = self._complete(
+                provider,
+                "feedback",
+                feedback_text,
+                target_language,
+                model,
+                system_prompt,
+                stream,
+                cancellation_handler,
+                token_callback,
             )
 
             # Log the feedback application prompts and response
@@ -397,14 +505,16 @@ class Translator:
                 anthropic_client=self.anthropic_client
             )
 
-            translated_text, usage, error = provider.translate_text(
-                text=fields_text,
-                target_language=target_language,
-                model=model,
-                system_prompt=system_prompt,
-                stream=stream,
-                cancellation_handler=cancellation_handler,
-                token_callback=token_callback
+            translated_text, usage, error = self._complete(
+                provider,
+                "frontmatter",
+                fields_text,
+                target_language,
+                model,
+                system_prompt,
+                stream,
+                cancellation_handler,
+                token_callback,
             )
 
             if translated_text:
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# ABOUTME: Token usage accounting for translation API calls.
+# ABOUTME: Provides a lightweight slotted record that can be summed across steps.
+
+from typing import Dict, Optional, Union
+
+
+class Usage:
+    """Token usage for one or more API calls.
+
+    Providers and the Translator report usage as dictionaries with
+    'prompt_tokens', 'completion_tokens' and 'total_tokens' keys. The CLI
+    accumulates those into Usage records, which avoid a dict allocation and
+    three key lookups per step, and converts back with to_dict() for logging.
+    """
+
+    __slots__ = ("prompt_tokens", "completion_tokens", "total_tokens")
+
+    def __init__(
+        self, prompt_tokens: int = 0, completion_tokens: int = 0, total_tokens: int = 0
+    ):
+        """Initialize a usage record.
+
+        Args:
+            prompt_tokens: Number of input tokens
+            completion_tokens: Number of output tokens
+            total_tokens: Total number of tokens
+        """
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.total_tokens = total_tokens
+
+    @classmethod
+    def from_dict(cls, usage: Optional[Dict[str, int]]) -> "Usage":
+        """Create a usage record from a usage dictionary.
+
+        Args:
+            usage: Dictionary with token counts; missing keys count as zero
+
+        Returns:
+            A new Usage record
+        """
+        if not usage:
+            return cls()
+        return cls(
+            usage.get("prompt_tokens", 0),
+            usage.get("completion_tokens", 0),
+            usage.get("total_tokens", 0),
+        )
+
+    def add(self, other: Union["Usage", Dict[str, int]]) -> None:
+        """Add another usage record or usage dictionary to this one in place.
+
+        Args:
+            other: The usage to add
+        """
+        if isinstance(other, Usage):
+            self.prompt_tokens += other.prompt_tokens
+            self.completion_tokens += other.completion_tokens
+            self.total_tokens += other.total_tokens
+        elif other:
+            self.prompt_tokens += other.get("prompt_tokens", 0)
+            self.completion_tokens += other.get("completion_tokens", 0)
+            self.total_tokens += other.get("total_tokens", 0)
+
+    def __iadd__(self, other: Union["Usage", Dict[str, int]]) -> "Usage":
+        self.add(other)
+        return self
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert the usage record to a usage dictionary.
+
+        Returns:
+            Dictionary with 'prompt_tokens', 'completion_tokens' and 'total_tokens' keys
+        """
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+        }
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Usage):
+            return NotImplemented
+        return (
+            self.prompt_tokens == other.prompt_tokens
+            and self.completion_tokens == other.completion_tokens
+            and self.total_tokens == other.total_tokens
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Usage(prompt_tokens={self.prompt_tokens}, "
+            f"completion_tokens={self.completion_tokens}, "
+            f"total_tokens={self.total_tokens})"
+        )